@@ -3,23 +3,69 @@ AutoNotes Backend - Flask application entry point.
 Provides API endpoints for generating structured meeting notes from transcripts.
 """
 
-from flask import Flask, jsonify
+import os
+import logging
+
+import orjson
+from flask import Flask, Response, jsonify
 from flask_cors import CORS
 
 from routes.notes_routes import notes_bp
+from services import storage_service
+from utils.json_provider import OrjsonProvider
+from utils.logging_config import configure_logging
+from utils.validators import MAX_REQUEST_BYTES
+
+# Send logs through a background queue listener
+configure_logging()
+logger = logging.getLogger(__name__)
 
 # Initialize Flask application
 app = Flask(__name__)
 
+# Serialize JSON responses with orjson
+app.json = OrjsonProvider(app)
+
+# Werkzeug refuses a declared Content-Length past this size and stops
+# reading streamed bodies here; the notes routes turn a cut-off body into a 413
+app.config["MAX_CONTENT_LENGTH"] = MAX_REQUEST_BYTES
+
+# Check MongoDB once up front; the API still starts if it is unreachable
+try:
+    storage_service.initialize()
+except storage_service.StorageServiceError as e:
+    logger.warning("MongoDB not ready at startup: %s", e)
+
 # Configure CORS to allow all origins (adjust for production)
 CORS(app, resources={
     r"/api/*": {
         "origins": "*",
         "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-        "allow_headers": ["Content-Type", "Authorization"]
+        "allow_headers": ["Content-Type", "Authorization"],
+        "max_age": 86400  # Let browsers cache preflight responses for 24 hours
+    }
+})
+
+
+# Static response bodies, serialized once at startup
+_INDEX_BODY = orjson.dumps({
+    "service": "AutoNotes API",
+    "version": "1.0.0",
+    "status": "running",
+    "endpoints": {
+        "POST /api/notes": "Generate structured notes from transcript",
+        "POST /api/notes/stream": "Generate notes, streaming output as server-sent events",
+        "GET /api/notes/<id>": "Retrieve a specific note by ID",
+        "GET /api/notes": "List all notes (paginated)",
+        "GET /api/notes/health": "Check service health"
     }
 })
 
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "AutoNotes API"
+})
+
 
 @app.route('/')
 def index():
@@ -29,17 +75,7 @@ def index():
     Returns:
         JSON response with API information
     """
-    return jsonify({
-        "service": "AutoNotes API",
-        "version": "1.0.0",
-        "status": "running",
-        "endpoints": {
-            "POST /api/notes": "Generate structured notes from transcript",
-            "GET /api/notes/<id>": "Retrieve a specific note by ID",
-            "GET /api/notes": "List all notes (paginated)",
-            "GET /api/notes/health": "Check service health"
-        }
-    }), 200
+    return Response(_INDEX_BODY, status=200, mimetype="application/json")
 
 
 @app.route('/health')
@@ -50,10 +86,7 @@ def health():
     Returns:
         JSON response with health status
     """
-    return jsonify({
-        "status": "healthy",
-        "service": "AutoNotes API"
-    }), 200
+    return Response(_HEALTH_BODY, status=200, mimetype="application/json")
 
 
 # Register blueprints
@@ -69,6 +102,15 @@ def not_found(error):
     }), 404
 
 
+@app.errorhandler(413)
+def payload_too_large(error):
+    """Handle oversize request bodies with JSON response."""
+    return jsonify({
+        "error": "Payload too large",
+        "message": f"Request body exceeds {MAX_REQUEST_BYTES:,} bytes"
+    }), 413
+
+
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors with JSON response."""
@@ -80,9 +122,9 @@ def internal_error(error):
 
 if __name__ == '__main__':
     # Start Flask development server
-    # In production, use a WSGI server like Gunicorn or Waitress
+    # In production, use Gunicorn (gunicorn -c gunicorn.conf.py app:app) or Waitress
     app.run(
         host='0.0.0.0',  # Listen on all network interfaces
         port=5000,
-        debug=True  # Enable debug mode for development
+        debug=os.getenv("FLASK_DEBUG") == "1"  # Opt in to debug mode with FLASK_DEBUG=1
     )
@@ -0,0 +1,34 @@
+"""
+Gunicorn configuration for running the AutoNotes API in production.
+Usage: gunicorn -c gunicorn.conf.py app:app
+"""
+
+import os
+import multiprocessing
+
+# Server socket
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+
+# Worker processes: gevent workers multiplex many Groq-bound requests per process
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gevent"
+worker_connections = 1000
+
+# Keep client connections open between requests
+keepalive = 5
+
+# Must exceed the 30 second Groq API timeout
+timeout = 60
+
+
+def post_fork(server, worker):
+    """
+    Reset the MongoDB client in each worker.
+    
+    MongoClient is not fork-safe, so a client inherited from the master
+    (when preload_app is enabled) is discarded and each worker lazily
+    opens its own connection pool on first use.
+    """
+    from services.storage_service import close_connection
+    
+    close_connection()
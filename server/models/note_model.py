@@ -1,14 +1,16 @@
 """
-Data models for meeting notes using dataclasses.
+Data models for meeting notes using slotted dataclasses.
 Provides type-safe structures for notes and action items.
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+from bson.datetime_ms import DatetimeMS
 
-@dataclass
+
+@dataclass(slots=True)
 class ActionItem:
     """
     Represents a single action item from a meeting.
@@ -24,7 +26,11 @@ class ActionItem:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert action item to dictionary representation."""
-        return asdict(self)
+        return {
+            "text": self.text,
+            "owner": self.owner,
+            "due_date": self.due_date
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ActionItem":
@@ -36,7 +42,7 @@ class ActionItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     """
     Represents structured meeting notes generated from a transcript.
@@ -65,7 +71,10 @@ class Note:
         """
         return {
             "summary": self.summary,
-            "action_items": [item.to_dict() for item in self.action_items],
+            "action_items": [
+                {"text": item.text, "owner": item.owner, "due_date": item.due_date}
+                for item in self.action_items
+            ],
             "decisions": self.decisions,
             "keywords": self.keywords,
             "created_at": self.created_at.isoformat(),
@@ -91,6 +100,9 @@ class Note:
         created_at = data.get("created_at")
         if isinstance(created_at, str):
             created_at = datetime.fromisoformat(created_at)
+        elif isinstance(created_at, DatetimeMS):
+            # Naive UTC, matching what PyMongo decodes stored dates to
+            created_at = created_at.as_datetime().replace(tzinfo=None)
         elif created_at is None:
             created_at = datetime.utcnow()
             
@@ -3,27 +3,39 @@ Flask Blueprint for meeting notes API endpoints.
 Handles HTTP requests for note generation and retrieval.
 """
 
-from flask import Blueprint, request, jsonify
+import logging
+from flask import Blueprint, Response, abort, request, jsonify, json, stream_with_context
 from typing import Dict, Any
 
-from services.llm_service import generate_notes, LLMServiceError
+from services.llm_service import (
+    generate_notes,
+    generate_notes_stream,
+    health_check as llm_health,
+    list_available_models,
+    test_model as test_llm_model,
+    LLMServiceError
+)
 from services.storage_service import (
     save_note, 
     get_note_by_id, 
     get_all_notes,
+    health_check as storage_health,
     StorageServiceError
 )
 from utils.validators import (
-    validate_transcript_request,
-    validate_llm_response,
-    sanitize_note_data,
+    validate_transcript_request_json,
     ValidationError
 )
-from models.note_model import Note, ActionItem
+
+logger = logging.getLogger(__name__)
 
 # Create Blueprint
 notes_bp = Blueprint('notes', __name__, url_prefix='/api/notes')
 
+# Pagination bounds for list_notes
+DEFAULT_LIST_LIMIT = 50
+MAX_LIST_LIMIT = 100
+
 
 @notes_bp.route('', methods=['POST'])
 def create_note():
@@ -52,32 +64,21 @@ def create_note():
         }
     
     Error Responses:
-        400: Invalid request (missing/empty transcript)
+        400: Invalid request (malformed JSON, missing/empty transcript)
+        413: Request body too large
         500: Internal server error (LLM or storage failure)
     """
+    # Read outside the try so a 413 reaches the app's error handler
+    raw_body = _read_request_body()
+    
     try:
-        # Get and validate request data
-        request_data = request.get_json()
-        transcript = validate_transcript_request(request_data)
+        # Parse and validate the raw body in one pass
+        transcript = validate_transcript_request_json(raw_body)
         
         # Generate notes using LLM
         notes_data = generate_notes(transcript)
         
-        # Sanitize and normalize the data
-        sanitized_data = sanitize_note_data(notes_data)
-        
-        # Create Note model instance
-        note = Note.from_dict(sanitized_data)
-        
-        # Save to database
-        note_dict = note.to_dict()
-        note_id = save_note(note_dict)
-        
-        # Retrieve the saved note (this properly converts ObjectId to string)
-        saved_note = get_note_by_id(note_id)
-        
-        if not saved_note:
-            raise StorageServiceError("Failed to retrieve saved note")
+        saved_note = _persist_notes(notes_data)
         
         return jsonify(saved_note), 200
         
@@ -99,9 +100,9 @@ def create_note():
             "message": str(e)
         }), 500
     
-    except Exception as e:
-        # Log unexpected errors (in production, use proper logging)
-        print(f"Unexpected error in create_note: {str(e)}")
+    except Exception:
+        # Log unexpected errors with traceback
+        logger.exception("Unexpected error in create_note")
         
         return jsonify({
             "error": "Internal server error",
@@ -109,6 +110,130 @@ def create_note():
         }), 500
 
 
+@notes_bp.route('/stream', methods=['POST'])
+def create_note_stream():
+    """
+    Generate structured meeting notes, streaming model output as it arrives.
+    
+    Request Body:
+        {
+            "transcript": "string - meeting transcript text"
+        }
+    
+    Response (200, text/event-stream):
+        event: delta   data: {"text": "string - generated text fragment"}
+        ...
+        event: note    data: saved note object (same structure as create_note)
+        
+        If generation or storage fails mid-stream, the stream ends with:
+        event: error   data: {"error": "string", "message": "string"}
+    
+    Error Responses:
+        400: Invalid request (malformed JSON, missing/empty transcript)
+        413: Request body too large
+    """
+    raw_body = _read_request_body()
+    
+    try:
+        transcript = validate_transcript_request_json(raw_body)
+        
+    except ValidationError as e:
+        return jsonify({
+            "error": "Validation error",
+            "message": str(e)
+        }), 400
+    
+    def generate_events():
+        try:
+            notes_data = None
+            for event, data in generate_notes_stream(transcript):
+                if event == "delta":
+                    yield _sse_event("delta", {"text": data})
+                else:
+                    notes_data = data
+            
+            yield _sse_event("note", _persist_notes(notes_data))
+            
+        except ValidationError as e:
+            yield _sse_event("error", {"error": "Validation error", "message": str(e)})
+        
+        except LLMServiceError as e:
+            yield _sse_event("error", {"error": "LLM service error", "message": str(e)})
+        
+        except StorageServiceError as e:
+            yield _sse_event("error", {"error": "Storage error", "message": str(e)})
+        
+        except Exception:
+            logger.exception("Unexpected error in create_note_stream")
+            
+            yield _sse_event("error", {
+                "error": "Internal server error",
+                "message": "An unexpected error occurred while processing your request"
+            })
+    
+    return Response(
+        stream_with_context(generate_events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _read_request_body() -> bytes:
+    """
+    Read the request body, refusing bodies larger than MAX_CONTENT_LENGTH.
+    
+    Werkzeug raises a 413 itself when Content-Length is too large, but a
+    chunked body is silently cut off at the limit. A body that fills the
+    limit is probed for one more byte to tell the two apart.
+    
+    Returns:
+        The raw request body
+        
+    Raises:
+        RequestEntityTooLarge: If the body exceeds MAX_CONTENT_LENGTH
+    """
+    raw_body = request.get_data()
+    
+    if request.content_length is None and len(raw_body) >= request.max_content_length:
+        if request.environ["wsgi.input"].read(1):
+            abort(413)
+    
+    return raw_body
+
+
+def _persist_notes(notes_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Save generated notes and return the stored note.
+    
+    Args:
+        notes_data: Validated, sanitized notes dictionary from the LLM service
+        
+    Returns:
+        The saved note, including its note_id
+        
+    Raises:
+        StorageServiceError: If the note cannot be saved
+    """
+    # The LLM service already returns the stored shape; copy it so the
+    # storage fields added below don't leak into results shared with
+    # concurrent callers
+    note_dict = dict(notes_data)
+    
+    # Save to database; this also stamps created_at
+    note_id = save_note(note_dict)
+    
+    # insert_one adds the raw ObjectId to the dict; expose it as a string instead
+    note_dict.pop("_id", None)
+    note_dict["note_id"] = note_id
+    
+    return note_dict
+
+
+def _sse_event(event: str, data: Any) -> str:
+    """Format a server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
 @notes_bp.route('/<note_id>', methods=['GET'])
 def get_note(note_id: str):
     """
@@ -141,8 +266,8 @@ def get_note(note_id: str):
             "message": str(e)
         }), 500
     
-    except Exception as e:
-        print(f"Unexpected error in get_note: {str(e)}")
+    except Exception:
+        logger.exception("Unexpected error in get_note")
         
         return jsonify({
             "error": "Internal server error",
@@ -161,23 +286,29 @@ def list_notes():
     
     Response (200):
         {
-            "notes": [array of note objects],
+            "notes": [array of note_id, summary, keywords, created_at],
             "count": number of notes returned,
             "limit": limit used,
             "skip": skip value used
         }
     
     Error Responses:
+        400: Non-integer limit or skip
         500: Internal server error
     """
     try:
-        # Parse query parameters
-        limit = request.args.get('limit', default=50, type=int)
-        skip = request.args.get('skip', default=0, type=int)
+        # Parse query parameters, clamping limit to 1..MAX_LIST_LIMIT and skip to >= 0
+        raw_limit = request.args.get('limit')
+        raw_skip = request.args.get('skip')
         
-        # Enforce limits
-        limit = min(max(1, limit), 100)  # Between 1 and 100
-        skip = max(0, skip)  # Non-negative
+        try:
+            limit = DEFAULT_LIST_LIMIT if raw_limit is None else max(1, min(MAX_LIST_LIMIT, int(raw_limit)))
+            skip = 0 if raw_skip is None else max(0, int(raw_skip))
+        except ValueError:
+            return jsonify({
+                "error": "Validation error",
+                "message": "Query parameters 'limit' and 'skip' must be integers"
+            }), 400
         
         # Retrieve notes
         notes = get_all_notes(limit=limit, skip=skip)
@@ -195,8 +326,8 @@ def list_notes():
             "message": str(e)
         }), 500
     
-    except Exception as e:
-        print(f"Unexpected error in list_notes: {str(e)}")
+    except Exception:
+        logger.exception("Unexpected error in list_notes")
         
         return jsonify({
             "error": "Internal server error",
@@ -218,9 +349,6 @@ def health_check():
             }
         }
     """
-    from services.llm_service import health_check as llm_health
-    from services.storage_service import health_check as storage_health
-    
     llm_status = llm_health()
     storage_status = storage_health()
     
@@ -260,8 +388,6 @@ def list_models():
         500: Failed to fetch models
     """
     try:
-        from services.llm_service import list_available_models
-        
         models_data = list_available_models()
         return jsonify(models_data), 200
         
@@ -271,8 +397,8 @@ def list_models():
             "message": str(e)
         }), 500
     
-    except Exception as e:
-        print(f"Unexpected error in list_models: {str(e)}")
+    except Exception:
+        logger.exception("Unexpected error in list_models")
         
         return jsonify({
             "error": "Internal server error",
@@ -305,8 +431,6 @@ def test_model():
         500: Model test failed
     """
     try:
-        from services.llm_service import test_model as test_llm_model
-        
         # Get prompt from query param or request body
         if request.method == 'POST':
             data = request.get_json() or {}
@@ -323,8 +447,8 @@ def test_model():
             "message": str(e)
         }), 500
     
-    except Exception as e:
-        print(f"Unexpected error in test_model: {str(e)}")
+    except Exception:
+        logger.exception("Unexpected error in test_model")
         
         return jsonify({
             "error": "Internal server error",
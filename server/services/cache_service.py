@@ -0,0 +1,154 @@
+"""
+Cache service for generated meeting notes.
+Keeps an in-process LRU in front of an optional Redis tier shared by all workers.
+"""
+
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+import orjson
+from dotenv import load_dotenv
+
+try:
+    import redis
+except ImportError:  # Redis tier is optional
+    redis = None
+
+# Load environment variables
+load_dotenv()
+
+# Cache configuration
+REDIS_URL = os.getenv("REDIS_URL")
+LOCAL_CACHE_SIZE = int(os.getenv("NOTES_CACHE_SIZE", "512"))
+REDIS_TTL_SECONDS = 24 * 60 * 60  # 24 hours
+REDIS_KEY_PREFIX = "autonotes:notes:"
+
+# In-process LRU: cache key -> serialized notes JSON
+_local_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_local_lock = threading.Lock()
+
+# Global Redis client instance (created on first use)
+_redis_client = None
+
+
+def notes_cache_key(transcript: str, model: str = "") -> str:
+    """
+    Build the cache key for a transcript.
+
+    Whitespace runs are collapsed so re-pasted transcripts that differ only
+    in line wrapping or indentation share an entry. The model name is part
+    of the key, so switching models never serves notes from the old one.
+    Only the 128-bit digest is kept, never the transcript itself.
+
+    Args:
+        transcript: Meeting transcript text
+        model: Name of the model that generates the notes
+
+    Returns:
+        Hex digest identifying the transcript and model
+    """
+    normalized = " ".join(transcript.split())
+    digest = hashlib.blake2b(model.encode("utf-8"), digest_size=16)
+    digest.update(b"\0")
+    digest.update(normalized.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _get_redis():
+    """
+    Get or create the Redis client.
+
+    Returns:
+        Redis client, or None if Redis is not configured or unavailable
+    """
+    global _redis_client
+
+    if _redis_client is None and REDIS_URL and redis is not None:
+        _redis_client = redis.Redis.from_url(
+            REDIS_URL,
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5
+        )
+
+    return _redis_client
+
+
+def _store_local(key: str, value: bytes) -> None:
+    """Insert an entry into the in-process LRU, evicting the oldest if full."""
+    with _local_lock:
+        _local_cache[key] = value
+        _local_cache.move_to_end(key)
+
+        while len(_local_cache) > LOCAL_CACHE_SIZE:
+            _local_cache.popitem(last=False)
+
+
+def get_cached_notes(transcript: str, model: str = "") -> Optional[Dict[str, Any]]:
+    """
+    Look up previously generated notes for a transcript.
+
+    Args:
+        transcript: Meeting transcript text
+        model: Name of the model that generates the notes
+
+    Returns:
+        A fresh copy of the cached notes dictionary, or None on a miss
+    """
+    key = notes_cache_key(transcript, model)
+
+    with _local_lock:
+        cached = _local_cache.get(key)
+        if cached is not None:
+            _local_cache.move_to_end(key)
+
+    if cached is None:
+        client = _get_redis()
+        if client is None:
+            return None
+
+        try:
+            cached = client.get(REDIS_KEY_PREFIX + key)
+        except Exception:
+            # Cache is best-effort; treat Redis failures as a miss
+            return None
+
+        if cached is None:
+            return None
+
+        _store_local(key, cached)
+
+    return orjson.loads(cached)
+
+
+def cache_notes(transcript: str, notes_data: Dict[str, Any], model: str = "") -> None:
+    """
+    Store generated notes for a transcript in both cache tiers.
+
+    Args:
+        transcript: Meeting transcript text
+        notes_data: Validated notes dictionary returned by the LLM
+        model: Name of the model that generated the notes
+    """
+    key = notes_cache_key(transcript, model)
+    serialized = orjson.dumps(notes_data)
+
+    _store_local(key, serialized)
+
+    client = _get_redis()
+    if client is None:
+        return
+
+    try:
+        client.set(REDIS_KEY_PREFIX + key, serialized, ex=REDIS_TTL_SECONDS)
+    except Exception:
+        pass
+
+
+def clear_cache() -> None:
+    """
+    Clear the in-process cache tier. The shared Redis tier expires on its own.
+    """
+    with _local_lock:
+        _local_cache.clear()
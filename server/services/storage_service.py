@@ -4,16 +4,20 @@ Provides CRUD operations with connection pooling and error handling.
 """
 
 import os
-from typing import Dict, Any, Optional
-from datetime import datetime
-from pymongo import MongoClient
+import time
+from typing import Dict, Any, List, Optional
+import pymongo
+from pymongo import MongoClient, DESCENDING
+from pymongo.collection import Collection
 from pymongo.errors import (
     ConnectionFailure, 
     ServerSelectionTimeoutError,
+    BulkWriteError,
     DuplicateKeyError,
     PyMongoError
 )
 from bson import ObjectId
+from bson.datetime_ms import DatetimeMS
 from dotenv import load_dotenv
 
 from models.note_model import Note, ActionItem
@@ -26,24 +30,54 @@ MONGO_URI = os.getenv("MONGO_URI")
 DATABASE_NAME = "autonotes"
 COLLECTION_NAME = "notes"
 
+# Upper bound on connectivity checks, so a down server can't stall callers
+PING_TIMEOUT_SECONDS = 1.0
+
+# Index backing the newest-first listing in get_all_notes
+CREATED_AT_INDEX = [("created_at", DESCENDING)]
+
+# Fields returned by get_all_notes unless the caller asks for others;
+# full notes (action items, decisions) are fetched individually by ID
+LIST_PROJECTION = {"summary": 1, "keywords": 1, "created_at": 1}
+
 # Global client instance (connection pooling)
 _mongo_client: Optional[MongoClient] = None
 
+# Notes collection handle, resolved once from the client
+_collection: Optional[Collection] = None
+
+# Whether the created_at index has been ensured in this process
+_indexes_ready = False
+
 
 class StorageServiceError(Exception):
     """Custom exception for storage service failures."""
     pass
 
 
+def _utc_now() -> DatetimeMS:
+    """
+    Current time as a BSON datetime, without building a datetime object.
+    
+    Stored as the same BSON date type as datetime values, so documents
+    written either way sort together.
+    """
+    return DatetimeMS(int(time.time() * 1000))
+
+
 def get_mongo_client() -> MongoClient:
     """
     Get or create MongoDB client with connection pooling.
     
+    The client connects in the background, so this returns without a
+    round trip to the server; failures surface on the first operation.
+    Use initialize() to verify the connection up front.
+    
     Returns:
         MongoClient instance
         
     Raises:
-        StorageServiceError: If connection cannot be established
+        StorageServiceError: If the client cannot be created
     """
     global _mongo_client
     
@@ -63,9 +97,6 @@ def get_mongo_client() -> MongoClient:
                 retryWrites=True
             )
             
-            # Verify connection by pinging the server
-            _mongo_client.admin.command('ping')
-            
         except (ConnectionFailure, ServerSelectionTimeoutError) as e:
             raise StorageServiceError(
                 f"Failed to connect to MongoDB: {str(e)}"
@@ -78,16 +109,60 @@ def get_mongo_client() -> MongoClient:
     return _mongo_client
 
 
-def get_collection():
+def initialize(mongo_uri: Optional[str] = None) -> None:
+    """
+    Verify the MongoDB connection and ensure indexes. Call once at startup.
+    
+    Args:
+        mongo_uri: Connection string to use instead of MONGO_URI; only
+            takes effect before the client has been created
+        
+    Raises:
+        StorageServiceError: If the server cannot be reached
+    """
+    global MONGO_URI
+    
+    if mongo_uri is not None:
+        MONGO_URI = mongo_uri
+    
+    client = get_mongo_client()
+    
+    try:
+        with pymongo.timeout(PING_TIMEOUT_SECONDS):
+            client.admin.command('ping')
+        
+        _ensure_indexes(get_collection())
+        
+    except PyMongoError as e:
+        raise StorageServiceError(f"Failed to connect to MongoDB: {str(e)}")
+
+
+def _ensure_indexes(collection: Collection) -> None:
+    """Create the created_at index once per process (idempotent on the server)."""
+    global _indexes_ready
+    
+    if not _indexes_ready:
+        collection.create_index(CREATED_AT_INDEX)
+        _indexes_ready = True
+
+
+def get_collection() -> Collection:
     """
     Get the notes collection from MongoDB.
     
+    The handle is created on first use and reused until close_connection().
+    
     Returns:
         pymongo.collection.Collection instance
     """
-    client = get_mongo_client()
-    database = client[DATABASE_NAME]
-    return database[COLLECTION_NAME]
+    global _collection
+    
+    if _collection is None:
+        client = get_mongo_client()
+        database = client[DATABASE_NAME]
+        _collection = database[COLLECTION_NAME]
+    
+    return _collection
 
 
 def save_note(note_data: Dict[str, Any]) -> str:
@@ -108,7 +183,7 @@ def save_note(note_data: Dict[str, Any]) -> str:
         
         # Add timestamp if not present
         if "created_at" not in note_data:
-            note_data["created_at"] = datetime.utcnow()
+            note_data["created_at"] = _utc_now()
         
         # Insert document
         result = collection.insert_one(note_data)
@@ -128,6 +203,54 @@ def save_note(note_data: Dict[str, Any]) -> str:
         raise StorageServiceError(f"Unexpected error saving note: {str(e)}")
 
 
+def save_notes_many(notes_data: List[Dict[str, Any]]) -> List[str]:
+    """
+    Save several meeting notes to MongoDB in one bulk write.
+    
+    Args:
+        notes_data: Note dictionaries to insert
+        
+    Returns:
+        String ObjectIds of the inserted documents, in input order
+        
+    Raises:
+        StorageServiceError: If the bulk write fails; notes that did not
+            fail are still inserted
+    """
+    if not notes_data:
+        return []
+    
+    try:
+        collection = get_collection()
+        
+        # Add timestamps where not present
+        created_at = _utc_now()
+        for note in notes_data:
+            if "created_at" not in note:
+                note["created_at"] = created_at
+        
+        # Unordered so one bad document doesn't stop the rest
+        result = collection.insert_many(notes_data, ordered=False)
+        
+        return [str(inserted_id) for inserted_id in result.inserted_ids]
+        
+    except BulkWriteError as e:
+        write_errors = e.details.get("writeErrors", [])
+        failed = ", ".join(
+            f"#{error['index']}: {error.get('errmsg', 'unknown error')}"
+            for error in write_errors
+        )
+        raise StorageServiceError(
+            f"Failed to save {len(write_errors)} of {len(notes_data)} notes ({failed})"
+        )
+    
+    except PyMongoError as e:
+        raise StorageServiceError(f"Database error while saving notes: {str(e)}")
+    
+    except Exception as e:
+        raise StorageServiceError(f"Unexpected error saving notes: {str(e)}")
+
+
 def get_note_by_id(note_id: str) -> Optional[Dict[str, Any]]:
     """
     Retrieve a meeting note by its ID.
@@ -143,10 +266,9 @@ def get_note_by_id(note_id: str) -> Optional[Dict[str, Any]]:
     """
     try:
         # Validate ObjectId format
-        try:
-            object_id = ObjectId(note_id)
-        except Exception:
+        if not ObjectId.is_valid(note_id):
             raise StorageServiceError(f"Invalid note ID format: {note_id}")
+        object_id = ObjectId(note_id)
         
         collection = get_collection()
         
@@ -171,13 +293,54 @@ def get_note_by_id(note_id: str) -> Optional[Dict[str, Any]]:
         raise StorageServiceError(f"Unexpected error retrieving note: {str(e)}")
 
 
-def get_all_notes(limit: int = 50, skip: int = 0) -> list[Dict[str, Any]]:
+def get_notes_by_ids(note_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Retrieve several meeting notes by ID with a single query.
+    
+    Args:
+        note_ids: String representations of the notes' ObjectIds
+        
+    Returns:
+        Note dictionaries in the order of note_ids; IDs that are malformed
+        or not found are skipped
+        
+    Raises:
+        StorageServiceError: If retrieval operation fails
+    """
+    object_ids = [ObjectId(note_id) for note_id in note_ids if ObjectId.is_valid(note_id)]
+    if not object_ids:
+        return []
+    
+    try:
+        collection = get_collection()
+        
+        found = {}
+        for note_doc in collection.find({"_id": {"$in": object_ids}}):
+            object_id = note_doc.pop("_id")
+            note_doc["note_id"] = str(object_id)
+            found[object_id] = note_doc
+        
+        return [found[object_id] for object_id in object_ids if object_id in found]
+        
+    except PyMongoError as e:
+        raise StorageServiceError(f"Database error while retrieving notes: {str(e)}")
+    
+    except Exception as e:
+        raise StorageServiceError(f"Unexpected error retrieving notes: {str(e)}")
+
+
+def get_all_notes(
+    limit: int = 50,
+    skip: int = 0,
+    projection: Optional[Dict[str, Any]] = None
+) -> list[Dict[str, Any]]:
     """
     Retrieve multiple notes with pagination.
     
     Args:
         limit: Maximum number of notes to return (default 50)
         skip: Number of notes to skip for pagination (default 0)
+        projection: Fields to return for each note (default LIST_PROJECTION)
         
     Returns:
         List of note dictionaries, sorted by creation date (newest first)
@@ -188,14 +351,27 @@ def get_all_notes(limit: int = 50, skip: int = 0) -> list[Dict[str, Any]]:
     try:
         collection = get_collection()
         
-        # Query with pagination and sorting
-        cursor = collection.find().sort("created_at", -1).skip(skip).limit(limit)
+        # The hint requires the index; usually already ensured by initialize()
+        _ensure_indexes(collection)
         
-        notes = []
-        for note_doc in cursor:
+        # Query with pagination and sorting, walking the created_at index
+        cursor = (
+            collection.find(
+                {},
+                LIST_PROJECTION if projection is None else projection,
+                hint=CREATED_AT_INDEX
+            )
+            .sort("created_at", DESCENDING)
+            .skip(skip)
+            .limit(limit)
+            .batch_size(limit)  # Whole page in the first reply, no getMore
+        )
+        
+        notes = list(cursor)
+        for note_doc in notes:
             # Convert ObjectId to string
-            note_doc["note_id"] = str(note_doc.pop("_id"))
-            notes.append(note_doc)
+            note_doc["note_id"] = str(note_doc["_id"])
+            del note_doc["_id"]
         
         return notes
         
@@ -221,10 +397,9 @@ def delete_note_by_id(note_id: str) -> bool:
     """
     try:
         # Validate ObjectId format
-        try:
-            object_id = ObjectId(note_id)
-        except Exception:
+        if not ObjectId.is_valid(note_id):
             raise StorageServiceError(f"Invalid note ID format: {note_id}")
+        object_id = ObjectId(note_id)
         
         collection = get_collection()
         
@@ -233,6 +408,9 @@ def delete_note_by_id(note_id: str) -> bool:
         
         return result.deleted_count > 0
         
+    except StorageServiceError:
+        raise
+    
     except PyMongoError as e:
         raise StorageServiceError(f"Database error while deleting note: {str(e)}")
     
@@ -244,7 +422,9 @@ def close_connection() -> None:
     """
     Close MongoDB connection. Should be called on application shutdown.
     """
-    global _mongo_client
+    global _mongo_client, _collection
+    
+    _collection = None
     
     if _mongo_client is not None:
         _mongo_client.close()
@@ -260,7 +440,8 @@ def health_check() -> bool:
     """
     try:
         client = get_mongo_client()
-        client.admin.command('ping')
+        with pymongo.timeout(PING_TIMEOUT_SECONDS):
+            client.admin.command('ping')
         return True
     except:
         return False
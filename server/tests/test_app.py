@@ -0,0 +1,311 @@
+"""
+Unit tests for the Flask application.
+Tests JSON serialization, app-level request limits and the notes routes.
+"""
+
+import io
+import json
+from datetime import datetime
+
+import pytest
+from unittest.mock import patch, MagicMock
+from bson import ObjectId
+from bson.datetime_ms import DatetimeMS
+from flask import jsonify
+from pymongo.errors import PyMongoError
+
+from app import app
+from utils.validators import MAX_REQUEST_BYTES
+from models.note_model import Note, ActionItem
+from services.llm_service import LLMServiceError
+
+
+@pytest.fixture
+def mock_collection():
+    """Back save_note with a mocked collection that assigns ObjectIds like insert_one."""
+    collection = MagicMock()
+    collection.inserted_id = ObjectId()
+
+    def insert_one(document):
+        document["_id"] = collection.inserted_id
+        return MagicMock(inserted_id=collection.inserted_id)
+
+    collection.insert_one.side_effect = insert_one
+    with patch('services.storage_service.get_collection', return_value=collection):
+        yield collection
+
+
+def valid_notes():
+    """Build sanitized notes as returned by the LLM service."""
+    return {
+        "summary": "Team agreed on the launch plan.",
+        "action_items": [{"text": "Send recap", "owner": "Ana", "due_date": None}],
+        "decisions": ["Launch on Monday"],
+        "keywords": ["launch"]
+    }
+
+
+def parse_events(body):
+    """Split a server-sent event stream into (event, data) pairs."""
+    events = []
+    for block in body.decode("utf-8").strip().split("\n\n"):
+        event_line, data_line = block.split("\n")
+        events.append((event_line[len("event: "):], json.loads(data_line[len("data: "):])))
+
+    return events
+
+
+class TestJsonProvider:
+    """Test suite for the OrjsonProvider JSON responses."""
+
+    def test_non_ascii_is_not_escaped(self):
+        """Test Unicode text is emitted as raw UTF-8 rather than \\u escapes."""
+        with app.test_request_context():
+            response = jsonify({"summary": "Réunion à Zürich 東京 🚀"})
+
+        body = response.get_data()
+        assert "Réunion à Zürich 東京 🚀".encode("utf-8") in body
+        assert b"\\u" not in body
+
+    def test_serializes_notes_and_object_ids(self):
+        """Test dataclasses, datetimes and ObjectIds serialize without to_dict."""
+        note = Note(
+            summary="Weekly sync",
+            action_items=[ActionItem(text="Send agenda", owner="Ana")],
+            decisions=[],
+            keywords=["sync"],
+            created_at=datetime(2025, 11, 12, 10, 30)
+        )
+        object_id = ObjectId()
+
+        with app.test_request_context():
+            response = jsonify({"note": note, "_id": object_id})
+
+        data = json.loads(response.get_data())
+        assert data["note"]["action_items"][0] == {
+            "text": "Send agenda",
+            "owner": "Ana",
+            "due_date": None
+        }
+        assert data["note"]["created_at"] == "2025-11-12T10:30:00+00:00"
+        assert data["_id"] == str(object_id)
+
+    def test_serializes_bson_datetime_ms(self):
+        """Test created_at values stamped by storage serialize as ISO 8601."""
+        with app.test_request_context():
+            response = jsonify({"created_at": DatetimeMS(1762943400000)})
+
+        data = json.loads(response.get_data())
+        assert data["created_at"] == "2025-11-12T10:30:00+00:00"
+
+    def test_rejects_unsupported_types(self):
+        """Test unsupported objects still raise TypeError."""
+        with app.test_request_context():
+            with pytest.raises(TypeError):
+                jsonify({"value": object()})
+
+
+class TestRequestSizeLimit:
+    """Test suite for the request body size limit."""
+
+    def test_oversize_body_rejected_before_route(self):
+        """Test a body larger than any valid transcript gets a JSON 413."""
+        client = app.test_client()
+
+        with patch('routes.notes_routes.generate_notes') as mock_generate:
+            response = client.post(
+                '/api/notes',
+                data=b"x" * (MAX_REQUEST_BYTES + 1),
+                content_type='application/json'
+            )
+
+        assert response.status_code == 413
+        assert response.get_json()["error"] == "Payload too large"
+        mock_generate.assert_not_called()
+
+    @pytest.mark.parametrize("path", ["/api/notes", "/api/notes/stream"])
+    def test_oversize_chunked_body_rejected(self, path):
+        """Test a chunked body with no Content-Length is not truncated into a 400."""
+        client = app.test_client()
+
+        with patch('routes.notes_routes.generate_notes') as mock_generate, \
+                patch('routes.notes_routes.generate_notes_stream') as mock_stream:
+            response = client.post(
+                path,
+                input_stream=io.BytesIO(b"x" * (MAX_REQUEST_BYTES + 1)),
+                headers={"Transfer-Encoding": "chunked", "Content-Type": "application/json"},
+                environ_base={"wsgi.input_terminated": True}
+            )
+
+        assert response.status_code == 413
+        assert response.get_json()["error"] == "Payload too large"
+        mock_generate.assert_not_called()
+        mock_stream.assert_not_called()
+
+    def test_chunked_body_at_limit_is_read(self):
+        """Test a chunked body of exactly the limit reaches validation."""
+        client = app.test_client()
+
+        response = client.post(
+            '/api/notes',
+            input_stream=io.BytesIO(b"x" * MAX_REQUEST_BYTES),
+            headers={"Transfer-Encoding": "chunked", "Content-Type": "application/json"},
+            environ_base={"wsgi.input_terminated": True}
+        )
+
+        assert response.status_code == 400
+        assert response.get_json()["message"] == "Request body must be valid JSON"
+
+
+class TestCreateNote:
+    """Test suite for POST /api/notes."""
+
+    def test_returns_saved_note(self, mock_collection):
+        """Test the response carries note_id and created_at but not the raw _id."""
+        client = app.test_client()
+
+        with patch('routes.notes_routes.generate_notes', return_value=valid_notes()) as mock_generate, \
+                patch('services.storage_service._utc_now', return_value=DatetimeMS(1762943400000)):
+            response = client.post('/api/notes', json={"transcript": " Weekly sync "})
+
+        assert response.status_code == 200
+        mock_generate.assert_called_once_with("Weekly sync")
+        assert response.get_json() == {
+            **valid_notes(),
+            "note_id": str(mock_collection.inserted_id),
+            "created_at": "2025-11-12T10:30:00+00:00"
+        }
+
+    def test_saves_without_a_database_round_trip(self, mock_collection):
+        """Test the note is inserted once and not read back to build the response."""
+        client = app.test_client()
+
+        with patch('routes.notes_routes.generate_notes', return_value=valid_notes()), \
+                patch('routes.notes_routes.get_note_by_id') as mock_get_note:
+            response = client.post('/api/notes', json={"transcript": "Weekly sync"})
+
+        assert response.status_code == 200
+        mock_collection.insert_one.assert_called_once()
+        mock_get_note.assert_not_called()
+
+    def test_shared_notes_are_not_mutated(self, mock_collection):
+        """Test storage fields are added to a copy, not the LLM service's result."""
+        client = app.test_client()
+        notes_data = valid_notes()
+
+        with patch('routes.notes_routes.generate_notes', return_value=notes_data):
+            client.post('/api/notes', json={"transcript": "Weekly sync"})
+
+        assert notes_data == valid_notes()
+
+    def test_storage_failure_returns_500(self, mock_collection):
+        """Test a failed insert is reported as a storage error."""
+        client = app.test_client()
+        mock_collection.insert_one.side_effect = PyMongoError("connection reset")
+
+        with patch('routes.notes_routes.generate_notes', return_value=valid_notes()):
+            response = client.post('/api/notes', json={"transcript": "Weekly sync"})
+
+        assert response.status_code == 500
+        assert response.get_json()["error"] == "Storage error"
+
+
+class TestCreateNoteStream:
+    """Test suite for POST /api/notes/stream server-sent events."""
+
+    def test_streams_deltas_then_saved_note(self, mock_collection):
+        """Test each fragment is sent as a delta event before the saved note."""
+        client = app.test_client()
+        events = [("delta", '{"summary": '), ("delta", '"Launch"}'), ("notes", valid_notes())]
+
+        with patch('routes.notes_routes.generate_notes_stream', return_value=iter(events)) as mock_stream:
+            response = client.post('/api/notes/stream', json={"transcript": " Weekly sync "})
+            body = response.get_data()
+
+        assert response.status_code == 200
+        assert response.mimetype == "text/event-stream"
+        assert response.headers["Cache-Control"] == "no-cache"
+        mock_stream.assert_called_once_with("Weekly sync")
+
+        parsed = parse_events(body)
+        assert parsed[:2] == [("delta", {"text": '{"summary": '}), ("delta", {"text": '"Launch"}'})]
+
+        event, note = parsed[2]
+        assert event == "note"
+        assert note["summary"] == "Team agreed on the launch plan."
+        assert note["note_id"] == str(mock_collection.inserted_id)
+        assert "_id" not in note
+        assert len(parsed) == 3
+
+    def test_mid_stream_failure_ends_with_error_event(self, mock_collection):
+        """Test an LLM failure after some output is reported as a final error event."""
+        client = app.test_client()
+
+        def failing_stream(transcript):
+            yield ("delta", '{"summary": ')
+            raise LLMServiceError("Groq API connection failed")
+
+        with patch('routes.notes_routes.generate_notes_stream', side_effect=failing_stream):
+            response = client.post('/api/notes/stream', json={"transcript": "Weekly sync"})
+            body = response.get_data()
+
+        assert response.status_code == 200
+        assert parse_events(body) == [
+            ("delta", {"text": '{"summary": '}),
+            ("error", {"error": "LLM service error", "message": "Groq API connection failed"})
+        ]
+        mock_collection.insert_one.assert_not_called()
+
+    @pytest.mark.parametrize("payload, message", [
+        ({"transcript": "   "}, "Field 'transcript' cannot be empty"),
+        ({"other": 1}, "Field 'transcript' is required")
+    ])
+    def test_invalid_request_returns_400(self, payload, message):
+        """Test bad input gets a JSON 400 before any stream is started."""
+        client = app.test_client()
+
+        with patch('routes.notes_routes.generate_notes_stream') as mock_stream:
+            response = client.post('/api/notes/stream', json=payload)
+
+        assert response.status_code == 400
+        assert response.get_json() == {"error": "Validation error", "message": message}
+        mock_stream.assert_not_called()
+
+
+class TestListNotes:
+    """Test suite for GET /api/notes query parameter handling."""
+
+    @pytest.mark.parametrize("query", ["limit=abc", "skip=1.5"])
+    def test_non_integer_params_rejected(self, query):
+        """Test non-integer limit or skip returns a 400 without querying storage."""
+        client = app.test_client()
+
+        with patch('routes.notes_routes.get_all_notes') as mock_get_all:
+            response = client.get(f'/api/notes?{query}')
+
+        assert response.status_code == 400
+        assert response.get_json() == {
+            "error": "Validation error",
+            "message": "Query parameters 'limit' and 'skip' must be integers"
+        }
+        mock_get_all.assert_not_called()
+
+    @pytest.mark.parametrize("query, limit, skip", [
+        ("", 50, 0),
+        ("limit=500&skip=-3", 100, 0),
+        ("limit=0&skip=20", 1, 20)
+    ])
+    def test_params_are_clamped(self, query, limit, skip):
+        """Test limit is clamped to 1..100 and skip to non-negative values."""
+        client = app.test_client()
+
+        with patch('routes.notes_routes.get_all_notes', return_value=[]) as mock_get_all:
+            response = client.get(f'/api/notes?{query}')
+
+        assert response.status_code == 200
+        mock_get_all.assert_called_once_with(limit=limit, skip=skip)
+        assert response.get_json() == {"notes": [], "count": 0, "limit": limit, "skip": skip}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
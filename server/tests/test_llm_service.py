@@ -1,58 +1,132 @@
 """
 Unit tests for LLM service.
-Tests the Gemini API integration with mocked responses.
+Tests the Groq API integration with mocked responses.
 """
 
+import asyncio
+import io
 import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import pytest
+import requests
 from unittest.mock import patch, Mock
 
-from services.llm_service import generate_notes, LLMServiceError
+from services import llm_service
+from services.llm_service import (
+    agenerate_notes_many,
+    generate_notes,
+    generate_notes_batch,
+    generate_notes_stream,
+    health_check,
+    LLMServiceError
+)
+from services.cache_service import clear_cache
 from utils.validators import ValidationError
 
 
+@pytest.fixture(autouse=True)
+def reset_notes_cache():
+    """Ensure every test starts with an empty notes cache."""
+    clear_cache()
+    yield
+    clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def disable_rate_limit():
+    """Keep the client-side RPM limiter from pacing unrelated tests."""
+    with patch('services.llm_service.RPM_LIMIT', 0):
+        yield
+
+
+@pytest.fixture
+def local_groq():
+    """
+    Serve a local HTTP stand-in for Groq through the sessions' real adapters.
+    
+    Yields a dict: set "delay" (seconds before answering), "status" and
+    "headers" before sending; "requests" counts what the server received.
+    """
+    state = {"delay": 0.0, "status": 200, "headers": {}, "requests": 0}
+    
+    class Handler(BaseHTTPRequestHandler):
+        def _answer(self):
+            state["requests"] += 1
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            time.sleep(state["delay"])
+            try:
+                self.send_response(state["status"])
+                for name, value in state["headers"].items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+            except OSError:
+                pass  # Client gave up waiting
+        
+        do_GET = do_POST = _answer
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    adapter = llm_service._SESSION.get_adapter(llm_service.GROQ_ENDPOINT)
+    probe_adapter = llm_service._PROBE_SESSION.get_adapter(llm_service.GROQ_MODELS_ENDPOINT)
+    
+    with patch.dict(llm_service._SESSION.adapters, {"http://": adapter}):
+        with patch.dict(llm_service._PROBE_SESSION.adapters, {"http://": probe_adapter}):
+            with patch('services.llm_service.GROQ_ENDPOINT', f"{base_url}/chat/completions"):
+                with patch('services.llm_service.GROQ_MODELS_ENDPOINT', f"{base_url}/models"):
+                    yield state
+    
+    server.shutdown()
+    server.server_close()
+
+
 class TestGenerateNotes:
     """Test suite for the generate_notes function."""
     
     def test_generate_notes_success(self):
         """Test successful note generation with valid API response."""
-        # Mock successful Gemini API response
+        # Mock successful Groq API response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "candidates": [
+        mock_response.content = json.dumps({
+            "choices": [
                 {
-                    "content": {
-                        "parts": [
-                            {
-                                "text": json.dumps({
-                                    "summary": "Team discussed Q4 goals and project timeline. Key milestones were identified for the upcoming sprint.",
-                                    "action_items": [
-                                        {
-                                            "text": "Create detailed project roadmap",
-                                            "owner": "John",
-                                            "due_date": "2025-11-20"
-                                        },
-                                        {
-                                            "text": "Schedule follow-up meeting",
-                                            "owner": "Sarah"
-                                        }
-                                    ],
-                                    "decisions": [
-                                        "Launch date set for December 1st",
-                                        "Budget approved for additional resources"
-                                    ],
-                                    "keywords": ["Q4", "goals", "timeline", "sprint", "milestones"]
-                                })
-                            }
-                        ]
+                    "message": {
+                        "content": json.dumps({
+                            "summary": "Team discussed Q4 goals and project timeline. Key milestones were identified for the upcoming sprint.",
+                            "action_items": [
+                                {
+                                    "text": "Create detailed project roadmap",
+                                    "owner": "John",
+                                    "due_date": "2025-11-20"
+                                },
+                                {
+                                    "text": "Schedule follow-up meeting",
+                                    "owner": "Sarah"
+                                }
+                            ],
+                            "decisions": [
+                                "Launch date set for December 1st",
+                                "Budget approved for additional resources"
+                            ],
+                            "keywords": ["Q4", "goals", "timeline", "sprint", "milestones"]
+                        })
                     }
                 }
             ]
-        }
+        }).encode()
         
-        with patch('services.llm_service.requests.post', return_value=mock_response):
-            with patch('services.llm_service.GEMINI_API_KEY', 'test-api-key'):
+        with patch('services.llm_service._SESSION.post', return_value=mock_response):
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
                 result = generate_notes("Mock meeting transcript about Q4 planning")
                 
                 # Assertions
@@ -76,44 +150,98 @@ class TestGenerateNotes:
         """Test parsing when LLM wraps JSON in markdown code blocks."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "candidates": [
+        mock_response.content = json.dumps({
+            "choices": [
                 {
-                    "content": {
-                        "parts": [
-                            {
-                                "text": "```json\n" + json.dumps({
-                                    "summary": "Brief meeting summary",
-                                    "action_items": [{"text": "Follow up on tasks"}],
-                                    "decisions": ["Approved proposal"],
-                                    "keywords": ["meeting", "tasks", "proposal", "team", "project"]
-                                }) + "\n```"
-                            }
-                        ]
+                    "message": {
+                        "content": "```json\n" + json.dumps({
+                            "summary": "Brief meeting summary",
+                            "action_items": [{"text": "Follow up on tasks"}],
+                            "decisions": ["Approved proposal"],
+                            "keywords": ["meeting", "tasks", "proposal", "team", "project"]
+                        }) + "\n```"
                     }
                 }
             ]
-        }
+        }).encode()
         
-        with patch('services.llm_service.requests.post', return_value=mock_response):
-            with patch('services.llm_service.GEMINI_API_KEY', 'test-api-key'):
+        with patch('services.llm_service._SESSION.post', return_value=mock_response):
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
                 result = generate_notes("Test transcript")
                 
                 assert "summary" in result
                 assert result["summary"] == "Brief meeting summary"
     
+    def test_parse_generated_text_strips_fence_variants(self):
+        """Test fences are removed regardless of language tag case or padding."""
+        expected = {"summary": "Fenced"}
+        
+        assert llm_service._parse_generated_text('  ```JSON\n{"summary": "Fenced"}\n```  ') == expected
+        assert llm_service._parse_generated_text('```\n{"summary": "Fenced"}```') == expected
+        assert llm_service._parse_generated_text('{"summary": "Fenced"}') == expected
+    
+    def test_generate_notes_decodes_large_response_incrementally(self):
+        """Test bodies over LARGE_RESPONSE_BYTES are read with ijson from the raw stream."""
+        pytest.importorskip("ijson")
+        
+        body = json.dumps({
+            "choices": [
+                {
+                    "message": {
+                        "content": json.dumps({
+                            "summary": "Large response summary",
+                            "action_items": [],
+                            "decisions": ["x" * 70000],
+                            "keywords": ["large"]
+                        })
+                    }
+                }
+            ]
+        }).encode()
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Length": str(len(body))}
+        mock_response.raw = io.BytesIO(body)
+        
+        with patch('services.llm_service._SESSION.post', return_value=mock_response):
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                result = generate_notes("Large transcript")
+        
+        assert result["summary"] == "Large response summary"
+        assert len(result["decisions"][0]) == 70000
+        mock_response.close.assert_called_once()
+    
+    def test_generate_notes_rejects_oversized_transcript(self):
+        """Test transcripts over the token limit fail before any upload."""
+        with patch('services.llm_service._SESSION.post') as mock_post:
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                with patch('services.llm_service.tiktoken', None):
+                    with pytest.raises(LLMServiceError) as exc_info:
+                        generate_notes("word " * 100000)
+        
+        assert str(exc_info.value) == "Transcript too long: 125000 tokens (maximum 120000)"
+        mock_post.assert_not_called()
+    
+    def test_short_transcripts_skip_token_counting(self):
+        """Test transcripts shorter than the limit in characters are never tokenized."""
+        with patch('services.llm_service._count_tokens') as mock_count:
+            llm_service._check_transcript_length("short meeting")
+        
+        mock_count.assert_not_called()
+    
     def test_generate_notes_missing_api_key(self):
         """Test error handling when API key is not configured."""
-        with patch('services.llm_service.GEMINI_API_KEY', None):
+        with patch('services.llm_service.GROQ_API_KEY', None):
             with pytest.raises(LLMServiceError) as exc_info:
                 generate_notes("Test transcript")
             
-            assert "GEMINI_API_KEY not configured" in str(exc_info.value)
+            assert "GROQ_API_KEY not configured" in str(exc_info.value)
     
     def test_generate_notes_api_timeout(self):
         """Test error handling for API timeout."""
-        with patch('services.llm_service.requests.post', side_effect=Exception("Timeout")):
-            with patch('services.llm_service.GEMINI_API_KEY', 'test-api-key'):
+        with patch('services.llm_service._SESSION.post', side_effect=Exception("Timeout")):
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
                 with pytest.raises(LLMServiceError):
                     generate_notes("Test transcript")
     
@@ -121,22 +249,18 @@ class TestGenerateNotes:
         """Test error handling when LLM returns invalid JSON."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "candidates": [
+        mock_response.content = json.dumps({
+            "choices": [
                 {
-                    "content": {
-                        "parts": [
-                            {
-                                "text": "This is not valid JSON"
-                            }
-                        ]
+                    "message": {
+                        "content": "This is not valid JSON"
                     }
                 }
             ]
-        }
+        }).encode()
         
-        with patch('services.llm_service.requests.post', return_value=mock_response):
-            with patch('services.llm_service.GEMINI_API_KEY', 'test-api-key'):
+        with patch('services.llm_service._SESSION.post', return_value=mock_response):
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
                 with pytest.raises(LLMServiceError) as exc_info:
                     generate_notes("Test transcript")
                 
@@ -146,25 +270,21 @@ class TestGenerateNotes:
         """Test error handling when LLM response is missing required fields."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "candidates": [
+        mock_response.content = json.dumps({
+            "choices": [
                 {
-                    "content": {
-                        "parts": [
-                            {
-                                "text": json.dumps({
-                                    "summary": "Only has summary field"
-                                    # Missing action_items, decisions, keywords
-                                })
-                            }
-                        ]
+                    "message": {
+                        "content": json.dumps({
+                            "summary": "Only has summary field"
+                            # Missing action_items, decisions, keywords
+                        })
                     }
                 }
             ]
-        }
+        }).encode()
         
-        with patch('services.llm_service.requests.post', return_value=mock_response):
-            with patch('services.llm_service.GEMINI_API_KEY', 'test-api-key'):
+        with patch('services.llm_service._SESSION.post', return_value=mock_response):
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
                 with pytest.raises(ValidationError) as exc_info:
                     generate_notes("Test transcript")
                 
@@ -174,32 +294,614 @@ class TestGenerateNotes:
         """Test error handling for HTTP errors from API."""
         mock_response = Mock()
         mock_response.status_code = 401
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "error": {
                 "message": "Invalid API key"
             }
-        }
+        }).encode()
         mock_response.raise_for_status.side_effect = Exception("HTTP Error")
         
-        with patch('services.llm_service.requests.post', return_value=mock_response):
-            with patch('services.llm_service.GEMINI_API_KEY', 'test-api-key'):
+        with patch('services.llm_service._SESSION.post', return_value=mock_response):
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
                 with pytest.raises(LLMServiceError):
                     generate_notes("Test transcript")
     
+    def test_generate_notes_http_error_includes_api_message(self):
+        """Test the Groq error message from the response body is surfaced."""
+        mock_response = Mock()
+        mock_response.status_code = 401
+        mock_response.content = json.dumps({
+            "error": {
+                "message": "Invalid API key"
+            }
+        }).encode()
+        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=mock_response
+        )
+        
+        with patch('services.llm_service._SESSION.post', return_value=mock_response):
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                with pytest.raises(LLMServiceError) as exc_info:
+                    generate_notes("Test transcript")
+                
+                assert str(exc_info.value) == "Groq API returned error 401: Invalid API key"
+    
     def test_generate_notes_empty_response(self):
         """Test error handling when API returns empty response."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "candidates": []
-        }
+        mock_response.content = json.dumps({
+            "choices": []
+        }).encode()
         
-        with patch('services.llm_service.requests.post', return_value=mock_response):
-            with patch('services.llm_service.GEMINI_API_KEY', 'test-api-key'):
+        with patch('services.llm_service._SESSION.post', return_value=mock_response):
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
                 with pytest.raises(LLMServiceError) as exc_info:
                     generate_notes("Test transcript")
                 
-                assert "no candidates" in str(exc_info.value).lower()
+                assert "no choices" in str(exc_info.value).lower()
+
+    def test_generate_notes_cache_hit_skips_api(self):
+        """Test repeated transcripts are served from cache."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "choices": [
+                {
+                    "message": {
+                        "content": json.dumps({
+                            "summary": "Cached meeting summary",
+                            "action_items": [],
+                            "decisions": [],
+                            "keywords": ["cache"]
+                        })
+                    }
+                }
+            ]
+        }).encode()
+        
+        with patch('services.llm_service._SESSION.post', return_value=mock_response) as mock_post:
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                first = generate_notes("Weekly sync:\n  discussed caching")
+                second = generate_notes("Weekly sync: discussed   caching")
+                
+                assert mock_post.call_count == 1
+                assert second == first
+                assert second is not first
+
+    def test_generate_notes_sanitizes_once_per_transcript(self):
+        """Test cache hits return stored notes without re-sanitizing them."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "choices": [
+                {
+                    "message": {
+                        "content": json.dumps({
+                            "summary": "  Sanitized summary ",
+                            "action_items": [{"text": " Follow up ", "owner": None}],
+                            "decisions": [],
+                            "keywords": ["Cache"]
+                        })
+                    }
+                }
+            ]
+        }).encode()
+        
+        with patch('services.llm_service._SESSION.post', return_value=mock_response):
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                with patch(
+                    'services.llm_service.validate_and_sanitize',
+                    wraps=llm_service.validate_and_sanitize
+                ) as mock_sanitize:
+                    first = generate_notes("Retro: follow up")
+                    second = generate_notes("Retro: follow up")
+                
+                assert mock_sanitize.call_count == 1
+                assert second == first
+                assert second["summary"] == "Sanitized summary"
+                assert second["keywords"] == ["cache"]
+    
+    def test_generate_notes_cache_is_keyed_by_model(self):
+        """Test switching GROQ_MODEL does not serve notes cached for another model."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "choices": [
+                {
+                    "message": {
+                        "content": json.dumps({
+                            "summary": "Model specific summary",
+                            "action_items": [],
+                            "decisions": [],
+                            "keywords": ["model"]
+                        })
+                    }
+                }
+            ]
+        }).encode()
+        
+        with patch('services.llm_service._SESSION.post', return_value=mock_response) as mock_post:
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                generate_notes("Model switch meeting")
+                with patch('services.llm_service.GROQ_MODEL', 'gemma2-9b-it'):
+                    generate_notes("Model switch meeting")
+                
+                assert mock_post.call_count == 2
+                sent_models = [
+                    json.loads(call.kwargs["data"])["model"] for call in mock_post.call_args_list
+                ]
+                assert sent_models == [llm_service.GROQ_MODEL, "gemma2-9b-it"]
+
+    def test_generate_notes_concurrent_identical_requests_share_call(self):
+        """Test concurrent identical transcripts trigger a single API call."""
+        release = threading.Event()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "choices": [
+                {
+                    "message": {
+                        "content": json.dumps({
+                            "summary": "Shared meeting summary",
+                            "action_items": [],
+                            "decisions": [],
+                            "keywords": ["shared"]
+                        })
+                    }
+                }
+            ]
+        }).encode()
+        
+        def slow_post(*args, **kwargs):
+            release.wait(timeout=5)
+            return mock_response
+        
+        results = []
+        
+        def worker():
+            results.append(generate_notes("Concurrent transcript"))
+        
+        with patch('services.llm_service._SESSION.post', side_effect=slow_post) as mock_post:
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                threads = [threading.Thread(target=worker) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                
+                # Wait until the first caller is blocked in the API request
+                while mock_post.call_count == 0:
+                    time.sleep(0.01)
+                release.set()
+                
+                for thread in threads:
+                    thread.join(timeout=5)
+                
+                assert mock_post.call_count == 1
+                assert len(results) == 4
+                assert all(r["summary"] == "Shared meeting summary" for r in results)
+
+    def test_generate_notes_batches_concurrent_transcripts(self):
+        """Test distinct transcripts within the batch window share one API call."""
+        def batch_post(*args, **kwargs):
+            user_content = json.loads(kwargs["data"])["messages"][1]["content"]
+            transcripts = re.findall(r"=== TRANSCRIPT \d+ ===\n(.*)", user_content)
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.content = json.dumps({
+                "choices": [
+                    {
+                        "message": {
+                            "content": json.dumps({
+                                "results": [
+                                    {
+                                        "summary": transcript,
+                                        "action_items": [],
+                                        "decisions": [],
+                                        "keywords": ["batch"]
+                                    }
+                                    for transcript in transcripts
+                                ]
+                            })
+                        }
+                    }
+                ]
+            }).encode()
+            return mock_response
+        
+        results = {}
+        
+        def worker(name):
+            results[name] = generate_notes(name)
+        
+        with patch('services.llm_service._SESSION.post', side_effect=batch_post) as mock_post:
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                with patch('services.llm_service.BATCH_WINDOW_MS', 200):
+                    threads = [
+                        threading.Thread(target=worker, args=(name,))
+                        for name in ("alpha meeting", "beta meeting")
+                    ]
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join(timeout=5)
+                
+                assert mock_post.call_count == 1
+                assert results["alpha meeting"]["summary"] == "alpha meeting"
+                assert results["beta meeting"]["summary"] == "beta meeting"
+
+
+class TestGenerateNotesBatch:
+    """Test suite for the generate_notes_batch function."""
+    
+    @staticmethod
+    def _batch_post(*args, **kwargs):
+        """Echo each sentinel-delimited transcript back as its summary."""
+        user_content = json.loads(kwargs["data"])["messages"][1]["content"]
+        transcripts = re.findall(r"=== TRANSCRIPT \d+ ===\n(.*)", user_content)
+        if not transcripts:
+            transcripts = [user_content.split("\n", 1)[1]]
+            content = {"summary": transcripts[0], "action_items": [], "decisions": [], "keywords": []}
+        else:
+            content = {
+                "results": [
+                    {"summary": transcript, "action_items": [], "decisions": [], "keywords": []}
+                    for transcript in transcripts
+                ]
+            }
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "choices": [{"message": {"content": json.dumps(content)}}]
+        }).encode()
+        return mock_response
+    
+    def test_generate_notes_batch_packs_transcripts_per_call(self):
+        """Test transcripts are grouped up to max_rows_per_call and kept in order."""
+        transcripts = ["first meeting", "second meeting", "third meeting"]
+        
+        with patch('services.llm_service._SESSION.post', side_effect=self._batch_post) as mock_post:
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                results = generate_notes_batch(transcripts, max_rows_per_call=2)
+        
+        assert mock_post.call_count == 2
+        assert [r["summary"] for r in results] == transcripts
+    
+    def test_generate_notes_batch_falls_back_on_length_mismatch(self):
+        """Test a batch response with the wrong entry count is retried individually."""
+        def short_batch_post(*args, **kwargs):
+            user_content = json.loads(kwargs["data"])["messages"][1]["content"]
+            if "=== TRANSCRIPT" not in user_content:
+                return self._batch_post(*args, **kwargs)
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.content = json.dumps({
+                "choices": [{"message": {"content": json.dumps({"results": []})}}]
+            }).encode()
+            return mock_response
+        
+        with patch('services.llm_service._SESSION.post', side_effect=short_batch_post) as mock_post:
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                results = generate_notes_batch(["alpha meeting", "beta meeting"])
+        
+        assert mock_post.call_count == 3
+        assert [r["summary"] for r in results] == ["alpha meeting", "beta meeting"]
+
+
+class TestGenerateNotesStream:
+    """Test suite for the generate_notes_stream function."""
+    
+    def test_generate_notes_stream_yields_deltas_then_notes(self):
+        """Test streamed fragments are relayed and assembled into validated notes."""
+        notes_text = json.dumps({
+            "summary": "Streamed meeting summary",
+            "action_items": [{"text": "Ship streaming"}],
+            "decisions": ["Use SSE"],
+            "keywords": ["stream"]
+        })
+        fragments = [notes_text[:20], notes_text[20:]]
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_lines.return_value = [
+            b"data: " + json.dumps({"choices": [{"delta": {"role": "assistant"}}]}).encode(),
+            b"",
+            *[
+                b"data: " + json.dumps({"choices": [{"delta": {"content": fragment}}]}).encode()
+                for fragment in fragments
+            ],
+            b"data: [DONE]"
+        ]
+        
+        with patch('services.llm_service._SESSION.post', return_value=mock_response) as mock_post:
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                events = list(generate_notes_stream("Streaming transcript"))
+                
+                assert mock_post.call_args.kwargs["stream"] is True
+                assert json.loads(mock_post.call_args.kwargs["data"])["stream"] is True
+                assert events[:-1] == [("delta", fragment) for fragment in fragments]
+                assert events[-1][0] == "notes"
+                assert events[-1][1]["summary"] == "Streamed meeting summary"
+                mock_response.close.assert_called_once()
+    
+    def test_generate_notes_stream_stops_at_finish_reason(self):
+        """Test the stream is not read past the chunk carrying finish_reason."""
+        notes_text = json.dumps({
+            "summary": "Finished early",
+            "action_items": [],
+            "decisions": [],
+            "keywords": []
+        })
+        
+        def lines():
+            yield b"data: " + json.dumps({
+                "choices": [{"delta": {"content": notes_text}, "finish_reason": "stop"}]
+            }).encode()
+            raise AssertionError("stream read past finish_reason")
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_lines.return_value = lines()
+        
+        with patch('services.llm_service._SESSION.post', return_value=mock_response):
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                events = list(generate_notes_stream("Early finish transcript"))
+                
+                assert events[-1][1]["summary"] == "Finished early"
+
+
+class TestAsyncGenerateNotes:
+    """Test suite for the async note generation helpers."""
+    
+    def test_agenerate_notes_many_preserves_order(self):
+        """Test concurrent generation returns notes in input order."""
+        def echo_post(*args, **kwargs):
+            transcript = json.loads(kwargs["data"])["messages"][1]["content"]
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.content = json.dumps({
+                "choices": [
+                    {
+                        "message": {
+                            "content": json.dumps({
+                                "summary": transcript,
+                                "action_items": [],
+                                "decisions": [],
+                                "keywords": ["async"]
+                            })
+                        }
+                    }
+                ]
+            }).encode()
+            return mock_response
+        
+        transcripts = [f"meeting {idx}" for idx in range(5)]
+        
+        with patch('services.llm_service._SESSION.post', side_effect=echo_post) as mock_post:
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                results = asyncio.run(agenerate_notes_many(transcripts, max_concurrency=2))
+                
+                assert mock_post.call_count == 5
+                assert [r["summary"] for r in results] == [f"Transcript:\n{t}" for t in transcripts]
+
+
+class TestRateLimiting:
+    """Test suite for client-side rate limiting and 429 handling."""
+    
+    def test_acquire_rpm_slot_waits_when_window_is_full(self):
+        """Test a request beyond the per-minute limit waits for the oldest slot."""
+        with patch('services.llm_service.RPM_LIMIT', 2):
+            with patch('services.llm_service._request_times', llm_service.deque()):
+                with patch('services.llm_service.time.monotonic', side_effect=[100.0, 110.0, 120.0, 160.0]):
+                    with patch('services.llm_service.time.sleep') as mock_sleep:
+                        llm_service._acquire_rpm_slot()
+                        llm_service._acquire_rpm_slot()
+                        mock_sleep.assert_not_called()
+                        
+                        llm_service._acquire_rpm_slot()
+                        
+                        mock_sleep.assert_called_once_with(40.0)
+                        assert list(llm_service._request_times) == [110.0, 160.0]
+    
+    def test_rate_limited_request_is_retried_after_retry_after(self):
+        """Test a 429 is retried once after the Retry-After delay."""
+        limited = Mock()
+        limited.status_code = 429
+        limited.headers = {"Retry-After": "2"}
+        
+        ok = Mock()
+        ok.status_code = 200
+        ok.content = json.dumps({
+            "choices": [{"message": {"content": json.dumps({
+                "summary": "After retry",
+                "action_items": [],
+                "decisions": [],
+                "keywords": []
+            })}}]
+        }).encode()
+        
+        with patch('services.llm_service._SESSION.post', side_effect=[limited, ok]) as mock_post:
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                with patch('services.llm_service.time.sleep') as mock_sleep:
+                    result = generate_notes("Rate limited transcript")
+        
+        assert result["summary"] == "After retry"
+        assert mock_post.call_count == 2
+        mock_sleep.assert_called_once_with(2.0)
+    
+    def test_session_retries_post_on_server_errors_only(self):
+        """Test completion POSTs are retried on 5xx but 429s are left to _send_request."""
+        retry = llm_service._SESSION.get_adapter(llm_service.GROQ_ENDPOINT).max_retries
+        
+        assert retry.is_retry("POST", 503) is True
+        assert retry.is_retry("POST", 429) is False
+        assert retry.is_retry("GET", 429) is True
+    
+    def test_timed_out_post_is_sent_once(self, local_groq):
+        """Test a read timeout on a completion is not retried by the adapter."""
+        local_groq["delay"] = 1.0
+        
+        start = time.monotonic()
+        with pytest.raises(LLMServiceError) as exc_info:
+            llm_service._post_chat_completion({"model": "test"}, timeout=0.3)
+        
+        assert time.monotonic() - start < 1.0
+        assert local_groq["requests"] == 1
+        assert str(exc_info.value) == "Groq API request timed out after 0.3 seconds"
+    
+    def test_post_retries_cap_retry_after_and_take_rpm_slots(self, local_groq):
+        """Test adapter retries of a 503 sleep at most the cap and count against the RPM limit."""
+        local_groq["status"] = 503
+        local_groq["headers"] = {"Retry-After": "60"}
+        
+        with patch('services.llm_service.RETRY_SLEEP_CAP_SECONDS', 0.05):
+            with patch('services.llm_service._acquire_rpm_slot') as mock_acquire:
+                start = time.monotonic()
+                with pytest.raises(LLMServiceError) as exc_info:
+                    llm_service._post_chat_completion({"model": "test"}, timeout=2)
+        
+        assert time.monotonic() - start < 2.0
+        assert local_groq["requests"] == 4
+        assert mock_acquire.call_count == 4
+        assert "503" in str(exc_info.value)
+    
+    def test_retry_backoff_is_jittered(self):
+        """Test backoff delays are drawn between zero and the exponential bound."""
+        retry = llm_service._SESSION.get_adapter(llm_service.GROQ_ENDPOINT).max_retries
+        retry = retry.increment("POST", "/", error=requests.exceptions.ConnectionError())
+        retry = retry.increment("POST", "/", error=requests.exceptions.ConnectionError())
+        
+        with patch('services.llm_service.random.uniform', return_value=0.1) as mock_uniform:
+            assert retry.get_backoff_time() == 0.1
+        
+        mock_uniform.assert_called_once_with(0, 0.6)
+    
+    def test_long_retry_after_is_not_waited_for(self):
+        """Test a Retry-After beyond the cap fails immediately."""
+        limited = Mock()
+        limited.status_code = 429
+        limited.headers = {"Retry-After": "120"}
+        limited.content = b"{}"
+        limited.raise_for_status.side_effect = requests.exceptions.HTTPError(response=limited)
+        
+        with patch('services.llm_service._SESSION.post', return_value=limited) as mock_post:
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                with pytest.raises(LLMServiceError) as exc_info:
+                    generate_notes("Heavily rate limited transcript")
+        
+        assert mock_post.call_count == 1
+        assert "429" in str(exc_info.value)
+
+
+class TestListAvailableModels:
+    """Test suite for the list_available_models function."""
+    
+    def test_list_available_models_reuses_prebuilt_response(self):
+        """Test the static models response is built once and flags the current model."""
+        with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+            first = llm_service.list_available_models()
+            second = llm_service.list_available_models()
+        
+        assert first is second
+        current = [model["name"] for model in first["models"] if model["current"]]
+        assert current == [llm_service.GROQ_MODEL]
+
+
+class TestTestModel:
+    """Test suite for the test_model function."""
+    
+    def test_test_model_uses_shared_request_path(self):
+        """Test model checks go through the shared session send path."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "choices": [{"message": {"content": "Yes, working."}}],
+            "usage": {"total_tokens": 12}
+        }).encode()
+        
+        with patch('services.llm_service._SESSION.post', return_value=mock_response) as mock_post:
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                result = llm_service.test_model("Ping?")
+        
+        assert result["status"] == "success"
+        assert result["response"] == "Yes, working."
+        assert mock_post.call_args.kwargs["timeout"] == llm_service.TEST_TIMEOUT_SECONDS
+        assert json.loads(mock_post.call_args.kwargs["data"])["messages"][0]["content"] == "Ping?"
+    
+    def test_test_model_reports_timeout(self):
+        """Test timeouts report the model test's own timeout."""
+        with patch('services.llm_service._SESSION.post', side_effect=requests.exceptions.Timeout()):
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                with pytest.raises(LLMServiceError) as exc_info:
+                    llm_service.test_model()
+        
+        assert str(exc_info.value) == "Groq API request timed out after 10 seconds"
+
+
+class TestHealthCheck:
+    """Test suite for the health_check function."""
+    
+    @pytest.fixture(autouse=True)
+    def reset_probe_failure(self):
+        """Start each test without a remembered probe failure."""
+        with patch('services.llm_service._last_probe_failure', None):
+            yield
+    
+    def test_health_check_probes_model_metadata(self):
+        """Test health is checked with a metadata request, not a generation."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        
+        with patch('services.llm_service._PROBE_SESSION.get', return_value=mock_response) as mock_get:
+            with patch('services.llm_service._SESSION.post') as mock_post:
+                with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                    with patch('services.llm_service._last_success', None):
+                        assert health_check() is True
+                        
+                        assert mock_get.call_args.args[0].endswith("/models/" + llm_service.GROQ_MODEL)
+                        mock_post.assert_not_called()
+    
+    def test_health_check_trusts_recent_success(self):
+        """Test a recent successful API call skips the upstream probe."""
+        with patch('services.llm_service._PROBE_SESSION.get') as mock_get:
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                with patch('services.llm_service._last_success', time.monotonic()):
+                    assert health_check() is True
+                    
+                    mock_get.assert_not_called()
+    
+    def test_health_check_reports_rejected_key(self):
+        """Test a non-200 metadata response marks the service unhealthy."""
+        mock_response = Mock()
+        mock_response.status_code = 401
+        
+        with patch('services.llm_service._PROBE_SESSION.get', return_value=mock_response):
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                with patch('services.llm_service._last_success', None):
+                    assert health_check() is False
+    
+    def test_health_check_reuses_recent_failure(self):
+        """Test repeated probes after a failure don't call Groq again."""
+        with patch('services.llm_service._PROBE_SESSION.get', side_effect=Exception("down")) as mock_get:
+            with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+                with patch('services.llm_service._last_success', None):
+                    assert health_check() is False
+                    assert health_check() is False
+                    
+                    assert mock_get.call_count == 1
+    
+    def test_health_check_does_not_retry_rate_limited_probe(self, local_groq):
+        """Test a 429 probe fails at once instead of sleeping on Retry-After."""
+        local_groq["status"] = 429
+        local_groq["headers"] = {"Retry-After": "3"}
+        
+        with patch('services.llm_service.GROQ_API_KEY', 'test-api-key'):
+            with patch('services.llm_service._last_success', None):
+                start = time.monotonic()
+                assert health_check() is False
+                assert health_check() is False
+        
+        assert time.monotonic() - start < 2.0
+        assert local_groq["requests"] == 1
 
 
 if __name__ == '__main__':
@@ -0,0 +1,220 @@
+"""
+Unit tests for storage service.
+Tests MongoDB operations against a mocked client.
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+from bson import ObjectId
+from bson.datetime_ms import DatetimeMS
+from pymongo.errors import BulkWriteError, ServerSelectionTimeoutError
+
+from services import storage_service
+from services.storage_service import (
+    close_connection,
+    delete_note_by_id,
+    get_all_notes,
+    get_collection,
+    get_mongo_client,
+    get_note_by_id,
+    get_notes_by_ids,
+    initialize,
+    save_note,
+    save_notes_many,
+    CREATED_AT_INDEX,
+    LIST_PROJECTION,
+    StorageServiceError
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_client():
+    """Provide a mocked MongoClient and reset module connection state."""
+    client = MagicMock()
+    close_connection()
+    with patch('services.storage_service._mongo_client', client):
+        yield client
+    storage_service._collection = None
+    storage_service._indexes_ready = False
+
+
+class TestGetCollection:
+    """Test suite for collection handle reuse."""
+
+    def test_collection_handle_is_reused(self, mock_client):
+        """Test the database and collection are looked up only once."""
+        first = get_collection()
+        second = get_collection()
+
+        assert first is second
+        mock_client.__getitem__.assert_called_once_with(storage_service.DATABASE_NAME)
+
+    def test_close_connection_resets_collection(self, mock_client):
+        """Test closing the connection drops the cached collection handle."""
+        get_collection()
+        close_connection()
+
+        assert storage_service._collection is None
+        mock_client.close.assert_called_once()
+
+
+class TestIndexes:
+    """Test suite for the created_at index."""
+
+    def test_initialize_pings_and_creates_created_at_index(self, mock_client):
+        """Test startup verifies the connection and ensures the listing index."""
+        initialize()
+
+        mock_client.admin.command.assert_called_once_with('ping')
+        collection = get_collection()
+        collection.create_index.assert_called_once_with(CREATED_AT_INDEX)
+
+    def test_get_mongo_client_does_not_ping(self):
+        """Test creating the client makes no round trip to the server."""
+        client = MagicMock()
+        with patch('services.storage_service._mongo_client', None):
+            with patch('services.storage_service.MONGO_URI', 'mongodb://test'):
+                with patch('services.storage_service.MongoClient', return_value=client):
+                    assert get_mongo_client() is client
+
+        client.admin.command.assert_not_called()
+
+    def test_initialize_reports_unreachable_server(self, mock_client):
+        """Test a failed startup ping is raised as a StorageServiceError."""
+        mock_client.admin.command.side_effect = ServerSelectionTimeoutError("timed out")
+
+        with pytest.raises(StorageServiceError) as exc_info:
+            initialize()
+
+        assert "Failed to connect to MongoDB" in str(exc_info.value)
+
+    def test_get_all_notes_hints_created_at_index(self, mock_client):
+        """Test the listing query is pinned to the created_at index."""
+        collection = get_collection()
+
+        get_all_notes(limit=10, skip=5)
+
+        collection.find.assert_called_once_with({}, LIST_PROJECTION, hint=CREATED_AT_INDEX)
+
+    def test_get_all_notes_fetches_page_in_one_batch(self, mock_client):
+        """Test the cursor batch size matches the page and IDs are stringified."""
+        collection = get_collection()
+        cursor = collection.find.return_value.sort.return_value.skip.return_value.limit.return_value
+        object_id = ObjectId()
+        cursor.batch_size.return_value = iter([{"_id": object_id, "summary": "Sync"}])
+
+        notes = get_all_notes(limit=20)
+
+        cursor.batch_size.assert_called_once_with(20)
+        assert notes == [{"summary": "Sync", "note_id": str(object_id)}]
+
+    def test_get_all_notes_accepts_custom_projection(self, mock_client):
+        """Test callers can request fields beyond the list view."""
+        collection = get_collection()
+
+        get_all_notes(projection={"decisions": 1})
+
+        collection.find.assert_called_once_with({}, {"decisions": 1}, hint=CREATED_AT_INDEX)
+
+
+class TestSaveNote:
+    """Test suite for single note inserts."""
+
+    def test_save_note_stamps_bson_datetime(self, mock_client):
+        """Test a missing created_at is stamped as a BSON datetime."""
+        collection = get_collection()
+        inserted_id = ObjectId()
+        collection.insert_one.return_value.inserted_id = inserted_id
+        note = {"summary": "Stamped"}
+
+        assert save_note(note) == str(inserted_id)
+        assert isinstance(note["created_at"], DatetimeMS)
+
+    def test_save_note_keeps_existing_created_at(self, mock_client):
+        """Test a caller-provided created_at is stored unchanged."""
+        collection = get_collection()
+        collection.insert_one.return_value.inserted_id = ObjectId()
+        note = {"summary": "Imported", "created_at": "2025-11-12T10:30:00"}
+
+        save_note(note)
+
+        assert note["created_at"] == "2025-11-12T10:30:00"
+
+
+class TestSaveNotesMany:
+    """Test suite for bulk note inserts."""
+
+    def test_save_notes_many_inserts_in_one_call(self, mock_client):
+        """Test notes are stamped and written with a single unordered insert."""
+        collection = get_collection()
+        inserted_ids = [ObjectId(), ObjectId()]
+        collection.insert_many.return_value.inserted_ids = inserted_ids
+        notes = [{"summary": "One"}, {"summary": "Two"}]
+
+        result = save_notes_many(notes)
+
+        assert result == [str(inserted_id) for inserted_id in inserted_ids]
+        collection.insert_many.assert_called_once_with(notes, ordered=False)
+        assert all("created_at" in note for note in notes)
+
+    def test_save_notes_many_reports_failed_documents(self, mock_client):
+        """Test per-document bulk write failures are surfaced."""
+        collection = get_collection()
+        collection.insert_many.side_effect = BulkWriteError({
+            "writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}],
+            "nInserted": 1
+        })
+
+        with pytest.raises(StorageServiceError) as exc_info:
+            save_notes_many([{"summary": "One"}, {"summary": "Two"}])
+
+        assert str(exc_info.value) == "Failed to save 1 of 2 notes (#1: duplicate key)"
+
+    def test_save_notes_many_empty_list(self, mock_client):
+        """Test an empty batch does not touch the database."""
+        assert save_notes_many([]) == []
+        mock_client.__getitem__.assert_not_called()
+
+
+class TestGetNotesByIds:
+    """Test suite for bulk note lookups."""
+
+    def test_get_notes_by_ids_uses_single_query(self, mock_client):
+        """Test valid IDs are fetched with one $in query and returned in input order."""
+        collection = get_collection()
+        first, second = ObjectId(), ObjectId()
+        collection.find.return_value = iter([
+            {"_id": second, "summary": "Second"},
+            {"_id": first, "summary": "First"}
+        ])
+
+        notes = get_notes_by_ids([str(first), "bad-id", str(second), str(ObjectId())])
+
+        collection.find.assert_called_once()
+        query = collection.find.call_args.args[0]
+        assert len(query["_id"]["$in"]) == 3
+        assert [note["summary"] for note in notes] == ["First", "Second"]
+        assert notes[0]["note_id"] == str(first)
+
+
+class TestNoteIdValidation:
+    """Test suite for ObjectId validation before queries."""
+
+    def test_get_note_by_id_rejects_invalid_id(self, mock_client):
+        """Test malformed IDs fail without touching the database."""
+        with pytest.raises(StorageServiceError) as exc_info:
+            get_note_by_id("not-an-object-id")
+
+        assert "Invalid note ID format" in str(exc_info.value)
+        mock_client.__getitem__.assert_not_called()
+
+    def test_delete_note_by_id_rejects_invalid_id(self, mock_client):
+        """Test malformed IDs are reported as such on delete."""
+        with pytest.raises(StorageServiceError) as exc_info:
+            delete_note_by_id("not-an-object-id")
+
+        assert str(exc_info.value) == "Invalid note ID format: not-an-object-id"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
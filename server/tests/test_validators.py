@@ -0,0 +1,308 @@
+"""
+Unit tests for validators.
+Runs each check with and without the compiled pydantic-core schemas.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from utils import validators
+from utils.validators import (
+    validate_and_sanitize,
+    validate_llm_response,
+    validate_llm_responses_batch,
+    validate_transcript_request,
+    validate_transcript_request_json,
+    validate_transcripts_batch,
+    ValidationError
+)
+
+
+@pytest.fixture(autouse=True, params=["native", "python"])
+def validator_mode(request):
+    """Run every test against the native fast path and the pure-Python path."""
+    if request.param == "native" and validators.SchemaValidator is None:
+        pytest.skip("pydantic-core is not installed")
+
+    if request.param == "python":
+        with patch('utils.validators._LLM_RESPONSE_BATCH_SCHEMA', None):
+            yield request.param
+    else:
+        yield request.param
+
+
+def valid_notes():
+    """Build a minimal valid LLM notes response."""
+    return {
+        "summary": "Team agreed on the launch plan.",
+        "action_items": [{"text": "Send recap", "owner": "Ana"}],
+        "decisions": ["Launch on Monday"],
+        "keywords": ["launch"]
+    }
+
+
+class TestValidateTranscriptRequest:
+    """Test suite for validate_transcript_request."""
+
+    def test_returns_stripped_transcript(self):
+        """Test surrounding whitespace is removed from the transcript."""
+        assert validate_transcript_request({"transcript": "  Weekly sync \n"}) == "Weekly sync"
+
+    def test_trims_python_whitespace_on_every_path(self):
+        """Test separator characters that str.strip() removes are trimmed on every path."""
+        assert validate_transcript_request({"transcript": "\x1cabc\x1c"}) == "abc"
+        assert validate_transcript_request_json(b'{"transcript": "\\u001cabc\\u001c"}') == "abc"
+        assert validate_transcripts_batch([{"transcript": "\x1cabc\x1c"}]) == ["abc"]
+
+    def test_returns_trimmed_transcript_unchanged(self):
+        """Test an already trimmed transcript is returned without copying it."""
+        transcript = "Weekly sync"
+    
+        assert validate_transcript_request({"transcript": transcript}) is transcript
+
+    def test_length_is_checked_after_trimming(self):
+        """Test padding does not count towards the length limit."""
+        transcript = "x" * 100000
+    
+        assert validate_transcript_request({"transcript": f"  {transcript}  "}) == transcript
+
+    @pytest.mark.parametrize("request_data, message", [
+        (None, "Request body is required"),
+        ({}, "Request body is required"),
+        (["transcript"], "Request body must be a JSON object"),
+        ({"other": 1}, "Field 'transcript' is required"),
+        ({"transcript": 42}, "Field 'transcript' must be a string"),
+        ({"transcript": "   "}, "Field 'transcript' cannot be empty"),
+        ({"transcript": "\x1f"}, "Field 'transcript' cannot be empty"),
+        ({"transcript": "x" * 100001}, "Transcript exceeds maximum length of 100,000 characters")
+    ])
+    def test_reports_specific_errors(self, request_data, message):
+        """Test invalid requests raise the matching error message."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_transcript_request(request_data)
+
+        assert str(exc_info.value) == message
+
+
+class TestValidateTranscriptRequestJson:
+    """Test suite for validate_transcript_request_json."""
+
+    def test_returns_stripped_transcript(self):
+        """Test a raw JSON body is parsed and its transcript trimmed."""
+        raw_body = '{"transcript": "  Réunion à Zürich \\n"}'.encode("utf-8")
+
+        assert validate_transcript_request_json(raw_body) == "Réunion à Zürich"
+
+    @pytest.mark.parametrize("raw_body, message", [
+        (b"", "Request body is required"),
+        (b"{}", "Request body is required"),
+        (b'{"transcript": ', "Request body must be valid JSON"),
+        (b'["transcript"]', "Request body must be a JSON object"),
+        (b'{"transcript": 42}', "Field 'transcript' must be a string"),
+        (b'{"transcript": " "}', "Field 'transcript' cannot be empty"),
+        (b'{"transcript": "\\u001f"}', "Field 'transcript' cannot be empty")
+    ])
+    def test_reports_specific_errors(self, raw_body, message):
+        """Test invalid bodies raise the matching error message."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_transcript_request_json(raw_body)
+
+        assert str(exc_info.value) == message
+
+
+class TestValidateTranscriptsBatch:
+    """Test suite for validate_transcripts_batch."""
+
+    def test_returns_stripped_transcripts_in_order(self):
+        """Test every transcript in the batch is validated and trimmed."""
+        requests_data = [{"transcript": " First "}, {"transcript": "Second\n"}]
+
+        assert validate_transcripts_batch(requests_data) == ["First", "Second"]
+
+    def test_reports_index_of_invalid_item(self):
+        """Test the first invalid item is named alongside its error."""
+        requests_data = [{"transcript": "First"}, {"transcript": "Second"}, {"transcript": " "}]
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_transcripts_batch(requests_data)
+
+        assert str(exc_info.value) == "Transcript at index 2: Field 'transcript' cannot be empty"
+
+    def test_reports_separator_only_transcript(self):
+        """Test a transcript of only str.isspace() separators is rejected."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_transcripts_batch([{"transcript": "First"}, {"transcript": "\x1f"}])
+
+        assert str(exc_info.value) == "Transcript at index 1: Field 'transcript' cannot be empty"
+
+    @pytest.mark.parametrize("item", [1, ["a"], "abc"])
+    def test_reports_non_object_item(self, item):
+        """Test items that are not request objects raise a ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_transcripts_batch([{"transcript": "First"}, item])
+
+        assert str(exc_info.value) == "Transcript at index 1: Request body must be a JSON object"
+
+
+class TestValidateLlmResponse:
+    """Test suite for validate_llm_response."""
+
+    def test_accepts_valid_response(self):
+        """Test a well-formed response passes."""
+        validate_llm_response(valid_notes())
+
+    def test_accepts_builtin_subclasses(self):
+        """Test str and list subclasses still pass the isinstance fallback."""
+        class Text(str):
+            pass
+    
+        notes = valid_notes()
+        notes["summary"] = Text("Subclassed summary")
+        notes["keywords"] = type("Keywords", (list,), {})(["launch"])
+    
+        validate_llm_response(notes)
+
+    @pytest.mark.parametrize("field, value, message", [
+        ("summary", 5, "Field 'summary' must be a string"),
+        ("summary", "  ", "Field 'summary' cannot be empty"),
+        ("summary", "\x1f", "Field 'summary' cannot be empty"),
+        ("action_items", {}, "Field 'action_items' must be a list"),
+        ("action_items", ["text"], "Action item at index 0 must be an object"),
+        ("action_items", [{"owner": "Ana"}], "Action item at index 0 missing 'text' field"),
+        ("action_items", [{"text": 1}], "Action item at index 0 'text' must be a string"),
+        ("decisions", ["ok", 2], "Decision at index 1 must be a string"),
+        ("keywords", [None], "Keyword at index 0 must be a string")
+    ])
+    def test_reports_specific_errors(self, field, value, message):
+        """Test invalid fields raise the matching error message."""
+        notes = valid_notes()
+        notes[field] = value
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_llm_response(notes)
+
+        assert str(exc_info.value) == message
+
+    def test_reports_missing_field(self):
+        """Test a missing top-level field is named in the error."""
+        notes = valid_notes()
+        del notes["keywords"]
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_llm_response(notes)
+
+        assert "missing required field" in str(exc_info.value)
+        assert "keywords" in str(exc_info.value)
+
+    def test_reports_all_missing_fields(self):
+        """Test every missing top-level field is named, in check order."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_llm_response({"decisions": []})
+
+        assert str(exc_info.value) == (
+            "LLM response missing required fields: 'summary', 'action_items', 'keywords'"
+        )
+
+
+class TestValidateLlmResponsesBatch:
+    """Test suite for validate_llm_responses_batch."""
+
+    def test_accepts_valid_responses(self):
+        """Test a list of well-formed responses passes."""
+        validate_llm_responses_batch([valid_notes(), valid_notes()])
+
+    def test_reports_index_of_invalid_response(self):
+        """Test the first invalid response is named alongside its error."""
+        invalid = valid_notes()
+        invalid["decisions"] = "Launch on Monday"
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_llm_responses_batch([valid_notes(), invalid, []])
+
+        assert str(exc_info.value) == "LLM response at index 1: Field 'decisions' must be a list"
+
+    def test_reports_separator_only_summary(self):
+        """Test a summary of only str.isspace() separators is rejected natively too."""
+        blank = valid_notes()
+        blank["summary"] = "\x1f"
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_llm_responses_batch([valid_notes(), blank])
+
+        assert str(exc_info.value) == "LLM response at index 1: Field 'summary' cannot be empty"
+
+
+class TestValidateAndSanitize:
+    """Test suite for validate_and_sanitize."""
+
+    def test_returns_normalized_notes(self):
+        """Test text is trimmed, keywords lowercased and blank optionals nulled."""
+        notes = {
+            "summary": "  Launch sync  ",
+            "action_items": [
+                {"text": " Send recap ", "owner": " Ana ", "due_date": ""},
+                {"text": "Book room", "owner": None}
+            ],
+            "decisions": [" Launch Monday "],
+            "keywords": [" Launch ", "QA"]
+        }
+
+        assert validate_and_sanitize(notes) == {
+            "summary": "Launch sync",
+            "action_items": [
+                {"text": "Send recap", "owner": "Ana", "due_date": None},
+                {"text": "Book room", "owner": None, "due_date": None}
+            ],
+            "decisions": ["Launch Monday"],
+            "keywords": ["launch", "qa"]
+        }
+
+    def test_keeps_free_text_due_dates(self):
+        """Test due dates are trimmed but not forced into a date format."""
+        notes = valid_notes()
+        notes["action_items"] = [
+            {"text": "Ship beta", "due_date": " 2025-11-14 "},
+            {"text": "Send recap", "due_date": "next Friday"}
+        ]
+
+        items = validate_and_sanitize(notes)["action_items"]
+
+        assert [item["due_date"] for item in items] == ["2025-11-14", "next Friday"]
+
+    def test_lowercases_non_ascii_keywords(self):
+        """Test keyword lowercasing covers non-ASCII letters as well."""
+        notes = valid_notes()
+        notes["keywords"] = ["ÉTÉ", "Straße", "ΣΥΝΑΝΤΗΣΗ"]
+
+        assert validate_and_sanitize(notes)["keywords"] == ["été", "straße", "συναντηση"]
+
+    def test_raises_same_errors_as_validate_llm_response(self):
+        """Test invalid entries are reported with the validator's messages."""
+        notes = valid_notes()
+        notes["keywords"] = ["ok", 3]
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_and_sanitize(notes)
+
+        assert str(exc_info.value) == "Keyword at index 1 must be a string"
+
+    def test_reports_index_of_non_string_decision(self):
+        """Test a non-string decision is reported at its index."""
+        notes = valid_notes()
+        notes["decisions"] = ["ok", "fine", {"text": "nested"}]
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_and_sanitize(notes)
+
+        assert str(exc_info.value) == "Decision at index 2 must be a string"
+
+    def test_rejects_non_object_response(self):
+        """Test a JSON array or string is rejected before field checks."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_and_sanitize(["summary"])
+
+        assert str(exc_info.value) == "LLM response must be a JSON object"
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,54 @@
+"""
+orjson-backed JSON provider for Flask.
+Serializes responses directly to bytes, including dataclasses and datetimes.
+"""
+
+from typing import Any, Union
+
+import orjson
+from bson import ObjectId
+from bson.datetime_ms import DatetimeMS
+from flask import Response
+from flask.json.provider import JSONProvider
+
+# Naive datetimes (e.g. datetime.utcnow()) are emitted with a UTC offset
+DUMPS_OPTIONS = orjson.OPT_NAIVE_UTC
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson does not support natively."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+
+    if isinstance(obj, DatetimeMS):
+        return obj.as_datetime()
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that uses orjson for encoding and decoding."""
+
+    mimetype = "application/json"
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string."""
+        return orjson.dumps(obj, default=_default, option=DUMPS_OPTIONS).decode("utf-8")
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize data from a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Serialize the given arguments as a JSON response.
+
+        The encoded bytes are passed straight to the response without an
+        intermediate str.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=DUMPS_OPTIONS),
+            mimetype=self.mimetype
+        )
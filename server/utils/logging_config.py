@@ -0,0 +1,46 @@
+"""
+Logging configuration for the AutoNotes backend.
+Hands log records to a background thread so request handlers never block on log I/O.
+"""
+
+import os
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING").upper()
+LOG_FILE = os.getenv("LOG_FILE")  # Defaults to stderr when unset
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+# Global listener instance (started once per process)
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging() -> None:
+    """
+    Route all logging through a queue drained by a background listener.
+
+    Request threads only enqueue records; the write to LOG_FILE (or
+    stderr) happens on the listener thread. Safe to call more than once.
+    """
+    global _listener
+
+    if _listener is not None:
+        return
+
+    if LOG_FILE:
+        target = RotatingFileHandler(LOG_FILE, maxBytes=10 * 1024 * 1024, backupCount=5)
+    else:
+        target = logging.StreamHandler()
+    target.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    _listener = QueueListener(log_queue, target, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(LOG_LEVEL)
+    root.addHandler(QueueHandler(log_queue))
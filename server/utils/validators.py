@@ -5,12 +5,110 @@ Ensures data integrity and provides clear error messages.
 
 from typing import Dict, Any, List
 
+import orjson
+
+try:
+    from pydantic_core import SchemaValidator, core_schema
+    from pydantic_core import ValidationError as SchemaValidationError
+except ImportError:  # Native validation is optional; the Python checks cover everything
+    SchemaValidator = None
+
+
+# Top-level fields every LLM notes response must contain, in check order
+LLM_RESPONSE_FIELDS = ("summary", "action_items", "decisions", "keywords")
+_LLM_RESPONSE_FIELD_SET = frozenset(LLM_RESPONSE_FIELDS)
+
+# Error message templates, formatted only when a check fails
+_MSG_MISSING_FIELD = "LLM response missing required field: '{}'".format
+_MSG_MISSING_FIELDS = "LLM response missing required fields: {}".format
+_MSG_ITEM_NOT_OBJECT = "Action item at index {} must be an object".format
+_MSG_ITEM_MISSING_TEXT = "Action item at index {} missing 'text' field".format
+_MSG_ITEM_TEXT_NOT_STRING = "Action item at index {} 'text' must be a string".format
+_MSG_DECISION_NOT_STRING = "Decision at index {} must be a string".format
+_MSG_KEYWORD_NOT_STRING = "Keyword at index {} must be a string".format
+_MSG_BATCH_ITEM = "Transcript at index {}: {}".format
+_MSG_BATCH_RESPONSE = "LLM response at index {}: {}".format
+
+# Longest transcript accepted by the API, in characters
+MAX_TRANSCRIPT_LENGTH = 100000
+
+# Largest request body worth decoding. A JSON string spends at most 6 bytes
+# per character (\uXXXX escapes); 1 KB covers the surrounding object.
+MAX_REQUEST_BYTES = MAX_TRANSCRIPT_LENGTH * 6 + 1024
+
+# Length error message, formatted once from the limit above
+_MSG_TRANSCRIPT_TOO_LONG = (
+    f"Transcript exceeds maximum length of {MAX_TRANSCRIPT_LENGTH:,} characters"
+)
+
 
 class ValidationError(Exception):
     """Custom exception for validation failures."""
     pass
 
 
+def _build_llm_response_batch_schema():
+    """
+    Compile the LLM response batch schema with pydantic-core.
+    
+    The compiled validator only decides whether data has the right shape.
+    Blank summaries are still caught in Python, since pydantic-core's trim
+    treats fewer characters as whitespace than str.strip(). Invalid data is
+    re-checked by the Python validators, which produce the error messages.
+    
+    Returns:
+        The LLM response batch validator
+    """
+    def required(schema):
+        return core_schema.typed_dict_field(schema, required=True)
+    
+    def strings():
+        return core_schema.list_schema(core_schema.str_schema(strict=True), strict=True)
+    
+    llm_response_schema = core_schema.typed_dict_schema(
+        {
+            "summary": required(core_schema.str_schema(strict=True)),
+            "action_items": required(core_schema.list_schema(
+                core_schema.typed_dict_schema(
+                    {"text": required(core_schema.str_schema(strict=True))},
+                    strict=True
+                ),
+                strict=True
+            )),
+            "decisions": required(strings()),
+            "keywords": required(strings())
+        },
+        strict=True
+    )
+    
+    return SchemaValidator(core_schema.list_schema(llm_response_schema, strict=True))
+
+
+_LLM_RESPONSE_BATCH_SCHEMA = _build_llm_response_batch_schema() if SchemaValidator is not None else None
+
+
+def _check_required_fields(response_data: Dict[str, Any]) -> None:
+    """
+    Ensure every top-level LLM response field is present.
+    
+    A single C-level set difference finds every missing field; they are
+    all reported in one error, in check order.
+    
+    Raises:
+        ValidationError: If any required field is missing
+    """
+    missing = _LLM_RESPONSE_FIELD_SET.difference(response_data)
+    if not missing:
+        return
+    
+    if len(missing) == 1:
+        raise ValidationError(_MSG_MISSING_FIELD(*missing))
+    
+    raise ValidationError(_MSG_MISSING_FIELDS(
+        ", ".join(f"'{field}'" for field in LLM_RESPONSE_FIELDS if field in missing)
+    ))
+
+
 def validate_transcript_request(request_data: Dict[str, Any]) -> str:
     """
     Validate incoming request contains a non-empty transcript.
@@ -22,106 +120,264 @@ def validate_transcript_request(request_data: Dict[str, Any]) -> str:
         The validated transcript string
         
     Raises:
-        ValidationError: If transcript is missing or empty
+        ValidationError: If the body is not an object or transcript is missing or empty
     """
     if not request_data:
         raise ValidationError("Request body is required")
     
+    if type(request_data) is not dict and not isinstance(request_data, dict):
+        raise ValidationError("Request body must be a JSON object")
+    
     transcript = request_data.get("transcript")
     
     if transcript is None:
         raise ValidationError("Field 'transcript' is required")
     
-    if not isinstance(transcript, str):
+    if type(transcript) is not str and not isinstance(transcript, str):
         raise ValidationError("Field 'transcript' must be a string")
     
-    transcript = transcript.strip()
+    return _trim_transcript(transcript)
+
+
+def _trim_transcript(transcript: str) -> str:
+    """
+    Trim a transcript string and check it is non-empty and within the limit.
     
-    if not transcript:
+    Raises:
+        ValidationError: If the transcript is blank or too long
+    """
+    # Only copy the string when there is whitespace to trim. An oversize
+    # transcript with no padding is rejected before any copy is made.
+    length = len(transcript)
+    padded = length and (transcript[0].isspace() or transcript[-1].isspace())
+    
+    if padded:
+        transcript = transcript.strip()
+        length = len(transcript)
+    
+    if not length:
         raise ValidationError("Field 'transcript' cannot be empty")
     
     # Basic length validation (prevent abuse)
-    if len(transcript) > 100000:  # 100k chars max
-        raise ValidationError("Transcript exceeds maximum length of 100,000 characters")
+    if length > MAX_TRANSCRIPT_LENGTH:
+        raise ValidationError(_MSG_TRANSCRIPT_TOO_LONG)
     
     return transcript
 
 
+def validate_transcript_request_json(raw_body: bytes) -> str:
+    """
+    Validate a raw JSON request body containing a transcript.
+    
+    The body is decoded with orjson and checked by validate_transcript_request.
+    
+    Args:
+        raw_body: Undecoded request body
+        
+    Returns:
+        The validated transcript string
+        
+    Raises:
+        ValidationError: If the body is not a JSON object with a valid transcript
+    """
+    if not raw_body:
+        raise ValidationError("Request body is required")
+    
+    try:
+        request_data = orjson.loads(raw_body)
+    except orjson.JSONDecodeError:
+        raise ValidationError("Request body must be valid JSON") from None
+    
+    return validate_transcript_request(request_data)
+
+
+def validate_transcripts_batch(requests_data: List[Dict[str, Any]]) -> List[str]:
+    """
+    Validate many transcript request bodies at once, e.g. for bulk imports.
+    
+    Each item gets the same checks as validate_transcript_request, and the
+    first invalid item is reported with its index.
+    
+    Args:
+        requests_data: List of request bodies, each with a transcript
+        
+    Returns:
+        The validated transcript strings, in input order
+        
+    Raises:
+        ValidationError: If the input is not a list or any item is invalid
+    """
+    if type(requests_data) is not list and not isinstance(requests_data, list):
+        raise ValidationError("Transcripts must be provided as a list")
+    
+    transcripts = []
+    for idx, request_data in enumerate(requests_data):
+        try:
+            transcripts.append(validate_transcript_request(request_data))
+        except ValidationError as e:
+            raise ValidationError(_MSG_BATCH_ITEM(idx, e)) from None
+    
+    return transcripts
+
+
 def validate_llm_response(response_data: Dict[str, Any]) -> None:
     """
     Validate that LLM response contains all required fields.
     
+    Runs validate_and_sanitize and discards the sanitized copy, so both
+    report exactly the same errors.
+    
     Args:
         response_data: Dictionary parsed from LLM JSON response
         
     Raises:
         ValidationError: If required fields are missing or invalid
     """
-    required_fields = ["summary", "action_items", "decisions", "keywords"]
+    validate_and_sanitize(response_data)
+
+
+def validate_llm_responses_batch(responses: List[Dict[str, Any]]) -> None:
+    """
+    Validate many LLM responses at once, e.g. for backfills or re-summaries.
     
-    for field in required_fields:
-        if field not in response_data:
-            raise ValidationError(f"LLM response missing required field: '{field}'")
+    The whole list is type-checked with one call into the compiled schema,
+    so only the blank-summary check runs per response in Python. If any
+    response is invalid, they are re-checked one by one to report the
+    first problem.
+    
+    Args:
+        responses: List of dictionaries parsed from LLM JSON responses
+        
+    Raises:
+        ValidationError: If the input is not a list or any response is invalid
+    """
+    if _LLM_RESPONSE_BATCH_SCHEMA is not None:
+        try:
+            _LLM_RESPONSE_BATCH_SCHEMA.validate_python(responses)
+        except SchemaValidationError:
+            pass
+        else:
+            # Blank summaries are left to str.isspace(), as in validate_and_sanitize
+            if all(response["summary"] and not response["summary"].isspace() for response in responses):
+                return
     
-    # Validate field types
-    if not isinstance(response_data["summary"], str):
+    if type(responses) is not list and not isinstance(responses, list):
+        raise ValidationError("LLM responses must be provided as a list")
+    
+    for idx, response_data in enumerate(responses):
+        try:
+            validate_and_sanitize(response_data)
+        except ValidationError as e:
+            raise ValidationError(_MSG_BATCH_RESPONSE(idx, e)) from None
+
+
+def _first_non_string(values: List[Any]) -> int:
+    """Return the index of the first value that is not a string."""
+    for idx, value in enumerate(values):
+        if not isinstance(value, str):
+            return idx
+    
+    return -1
+
+
+def validate_and_sanitize(response_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate an LLM response and build its sanitized form in a single pass.
+    
+    This is the single implementation of the LLM response checks; each
+    list is walked once to both check and normalize it.
+    Missing or non-string owners and due dates become None.
+    
+    The result stays a plain dict rather than the slotted models in
+    models.note_model: the notes cache, MongoDB inserts and JSON responses
+    all take mappings, and cached notes come back as dicts, so converting
+    would add a copy at every edge and mix types between hits and misses.
+    
+    Args:
+        response_data: Dictionary parsed from LLM JSON response
+        
+    Returns:
+        Sanitized note data, ready for storage
+        
+    Raises:
+        ValidationError: If required fields are missing or invalid
+    """
+    if type(response_data) is not dict and not isinstance(response_data, dict):
+        raise ValidationError("LLM response must be a JSON object")
+    
+    # Complete responses skip the helper call; it only runs to build the error
+    if _LLM_RESPONSE_FIELD_SET.difference(response_data):
+        _check_required_fields(response_data)
+    
+    summary = response_data["summary"]
+    action_items = response_data["action_items"]
+    decisions = response_data["decisions"]
+    keywords = response_data["keywords"]
+    
+    # Validate field types. JSON-decoded values are exact built-ins, so the
+    # type() identity check settles nearly every field before isinstance()
+    if type(summary) is not str and not isinstance(summary, str):
         raise ValidationError("Field 'summary' must be a string")
     
-    if not isinstance(response_data["action_items"], list):
+    if type(action_items) is not list and not isinstance(action_items, list):
         raise ValidationError("Field 'action_items' must be a list")
     
-    if not isinstance(response_data["decisions"], list):
+    if type(decisions) is not list and not isinstance(decisions, list):
         raise ValidationError("Field 'decisions' must be a list")
     
-    if not isinstance(response_data["keywords"], list):
+    if type(keywords) is not list and not isinstance(keywords, list):
         raise ValidationError("Field 'keywords' must be a list")
     
-    # Validate action items structure
-    for idx, action_item in enumerate(response_data["action_items"]):
-        if not isinstance(action_item, dict):
-            raise ValidationError(f"Action item at index {idx} must be an object")
+    # Validate and normalize action items
+    sanitized_items = []
+    for idx, action_item in enumerate(action_items):
+        if type(action_item) is not dict and not isinstance(action_item, dict):
+            raise ValidationError(_MSG_ITEM_NOT_OBJECT(idx))
         
         if "text" not in action_item:
-            raise ValidationError(f"Action item at index {idx} missing 'text' field")
+            raise ValidationError(_MSG_ITEM_MISSING_TEXT(idx))
+        
+        text = action_item["text"]
+        if type(text) is not str and not isinstance(text, str):
+            raise ValidationError(_MSG_ITEM_TEXT_NOT_STRING(idx))
+        
+        # Optional fields are usually absent or null; only strings are trimmed
+        owner = action_item.get("owner")
+        if owner is not None:
+            owner = (owner.strip() or None) if isinstance(owner, str) else None
         
-        if not isinstance(action_item["text"], str):
-            raise ValidationError(f"Action item at index {idx} 'text' must be a string")
+        due_date = action_item.get("due_date")
+        if due_date is not None:
+            due_date = (due_date.strip() or None) if isinstance(due_date, str) else None
+        
+        sanitized_items.append({"text": text.strip(), "owner": owner, "due_date": due_date})
+    
+    # Validate and normalize decisions and keywords. map() keeps the loop in
+    # C, and str.strip rejects non-strings by itself, so the failing index
+    # is only looked up when a check fails.
+    strip = str.strip
+    lower = str.lower
     
-    # Validate decisions are strings
-    for idx, decision in enumerate(response_data["decisions"]):
-        if not isinstance(decision, str):
-            raise ValidationError(f"Decision at index {idx} must be a string")
+    try:
+        sanitized_decisions = list(map(strip, decisions))
+    except TypeError:
+        raise ValidationError(_MSG_DECISION_NOT_STRING(_first_non_string(decisions))) from None
     
-    # Validate keywords are strings
-    for idx, keyword in enumerate(response_data["keywords"]):
-        if not isinstance(keyword, str):
-            raise ValidationError(f"Keyword at index {idx} must be a string")
+    try:
+        # str.lower() already has an ASCII fast path in CPython; ASCII-only
+        # translate tables measured slower and would mangle non-ASCII keywords
+        sanitized_keywords = list(map(lower, map(strip, keywords)))
+    except TypeError:
+        raise ValidationError(_MSG_KEYWORD_NOT_STRING(_first_non_string(keywords))) from None
     
     # Validate non-empty summary
-    if not response_data["summary"].strip():
+    summary = summary.strip()
+    if not summary:
         raise ValidationError("Field 'summary' cannot be empty")
-
-
-def sanitize_note_data(note_data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Sanitize and normalize note data before storage.
     
-    Args:
-        note_data: Raw note data from LLM
-        
-    Returns:
-        Sanitized note data
-    """
     return {
-        "summary": note_data["summary"].strip(),
-        "action_items": [
-            {
-                "text": item["text"].strip(),
-                "owner": item.get("owner", "").strip() or None,
-                "due_date": item.get("due_date", "").strip() or None
-            }
-            for item in note_data["action_items"]
-        ],
-        "decisions": [decision.strip() for decision in note_data["decisions"]],
-        "keywords": [keyword.strip().lower() for keyword in note_data["keywords"]]
+        "summary": summary,
+        "action_items": sanitized_items,
+        "decisions": sanitized_decisions,
+        "keywords": sanitized_keywords
     }